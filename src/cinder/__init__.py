@@ -1,32 +1,6 @@
 """Cinder API client library."""
-from .client import CinderClient, get_client
-from .sync_client import SyncCinderClient, get_sync_client
-
-# Export commonly used models for convenience
-from .generated.models import (
-    Appeal,
-    AppealFilterSchema,
-    CreateAppealSchema,
-    CreateDecisionSchema,
-    CreateEntitiesAndRelationshipsResponseSchema,
-    CreateEntitiesAndRelationshipsSchema,
-    CreateReportSchema,
-    CustomerEvent,
-    CustomerEventEntitySubgraph,
-    DecisionFilter,
-    DecisionSchema,
-    EntityApiSchema,
-    EventEntity,
-    EventRelationship,
-    PagedAppeal,
-    PagedDecisionSchema,
-    PagedReport,
-    RelationshipApiSchema,
-    Report,
-    ReportSchema,
-    StatusOkResponse,
-    WorkflowResult,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     # Async Client
@@ -35,6 +9,12 @@ __all__ = [
     # Sync Client
     "SyncCinderClient",
     "get_sync_client",
+    # Batching
+    "ReportBatcher",
+    # Transports
+    "AiohttpTransport",
+    "build_async_transport",
+    "build_transport",
     # Common models
     "Appeal",
     "AppealFilterSchema",
@@ -60,6 +40,67 @@ __all__ = [
     "WorkflowResult",
 ]
 
+# Submodules providing the public names, generated models excepted. Submodules
+# are imported on first attribute access (PEP 562), so `import cinder` does
+# not pay for httpx and the generated Pydantic models until they are used.
+_SUBMODULES = {
+    "CinderClient": ".client",
+    "get_client": ".client",
+    "SyncCinderClient": ".sync_client",
+    "get_sync_client": ".sync_client",
+    "ReportBatcher": ".batching",
+    "AiohttpTransport": ".transports",
+    "build_async_transport": ".transports",
+    "build_transport": ".transports",
+}
+_LAZY_IMPORTS = {name: _SUBMODULES.get(name, ".generated.models") for name in __all__}
+
+if TYPE_CHECKING:
+    from .batching import ReportBatcher
+    from .client import CinderClient, get_client
+    from .generated.models import (
+        Appeal,
+        AppealFilterSchema,
+        CreateAppealSchema,
+        CreateDecisionSchema,
+        CreateEntitiesAndRelationshipsResponseSchema,
+        CreateEntitiesAndRelationshipsSchema,
+        CreateReportSchema,
+        CustomerEvent,
+        CustomerEventEntitySubgraph,
+        DecisionFilter,
+        DecisionSchema,
+        EntityApiSchema,
+        EventEntity,
+        EventRelationship,
+        PagedAppeal,
+        PagedDecisionSchema,
+        PagedReport,
+        RelationshipApiSchema,
+        Report,
+        ReportSchema,
+        StatusOkResponse,
+        WorkflowResult,
+    )
+    from .sync_client import SyncCinderClient, get_sync_client
+    from .transports import AiohttpTransport, build_async_transport, build_transport
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 # Optional Django helpers
 try:
     from .django_helpers import (
@@ -0,0 +1,104 @@
+"""msgspec mirrors of the paged list responses, for the fast decode path.
+
+msgspec parses and type-checks JSON in a single pass, considerably faster
+than Pydantic for pages with many items. Only the top-level fields of each
+item are mirrored: nested objects are kept as plain dicts and lists, and
+enums as strings. Use ``to_model()`` to get the full Pydantic model of an
+item when needed.
+"""
+from datetime import datetime
+from typing import Any, ClassVar, Dict, Optional, Type
+
+import msgspec
+from pydantic import BaseModel
+
+from .generated.models import (
+    Appeal,
+    DecisionSchema,
+    PagedAppeal,
+    PagedDecisionSchema,
+    PagedReport,
+    Report,
+)
+
+
+class _FastItem(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+    """Base class for items decoded on the fast path."""
+
+    # Pydantic model mirrored by the struct
+    model: ClassVar[Type[BaseModel]]
+
+    def to_model(self) -> BaseModel:
+        """Convert the item to its (validated) Pydantic model."""
+        return self.model.model_validate(msgspec.structs.asdict(self))
+
+
+class FastDecision(_FastItem, frozen=True, gc=False, kw_only=True):
+    model: ClassVar[Type[BaseModel]] = DecisionSchema
+
+    uuid: str
+    entity: Dict[str, Any]
+    notes: str
+    is_training: bool
+    created_at: datetime
+    decision_type: str
+    user: Optional[str] = None
+    queue_slug: Optional[str] = None
+    job_id: Optional[str] = None
+    applied_policies: Optional[list[Dict[str, Any]]] = None
+    applied_actions: Optional[list[str]] = None
+    entity_slug: Optional[str] = None
+    entity_id: Optional[str] = None
+    handle_time_seconds: Optional[int] = None
+    resolution_time_seconds: Optional[int] = None
+    previous_decision_id: Optional[str] = None
+    next_decision_id: Optional[str] = None
+    form_submissions: Optional[list[Dict[str, Any]]] = None
+    job_assigned_at: Optional[datetime] = None
+    typed_metadata: Optional[Dict[str, Any]] = None
+
+
+class FastReport(_FastItem, frozen=True, gc=False, kw_only=True):
+    model: ClassVar[Type[BaseModel]] = Report
+
+    reasoning: str
+    created_at: datetime
+    metadata: Optional[Dict[str, Any]]
+    entity: Dict[str, Any]
+    reporter: Optional[Dict[str, Any]]
+    attribute_slugs: Optional[list[str]]
+
+
+class FastAppeal(_FastItem, frozen=True, gc=False, kw_only=True):
+    model: ClassVar[Type[BaseModel]] = Appeal
+
+    appealer: Optional[Dict[str, Any]]
+    appealer_reasoning: str
+    appealed_decision: Optional[Dict[str, Any]]
+    resolved_by_decision: Optional[Dict[str, Any]]
+    source: str
+    outcome: Optional[str]
+    created_at: datetime
+
+
+class FastPagedDecisions(msgspec.Struct, frozen=True, gc=False):
+    items: list[FastDecision]
+    count: int
+
+
+class FastPagedReports(msgspec.Struct, frozen=True, gc=False):
+    items: list[FastReport]
+    count: int
+
+
+class FastPagedAppeals(msgspec.Struct, frozen=True, gc=False):
+    items: list[FastAppeal]
+    count: int
+
+
+# Decoders by the Pydantic page model they replace
+DECODERS: Dict[Type[BaseModel], msgspec.json.Decoder] = {
+    PagedDecisionSchema: msgspec.json.Decoder(FastPagedDecisions),
+    PagedReport: msgspec.json.Decoder(FastPagedReports),
+    PagedAppeal: msgspec.json.Decoder(FastPagedAppeals),
+}
@@ -1,15 +1,324 @@
 """Base client with shared functionality."""
-from typing import Any, Dict, Optional
+import email.utils
+import functools
+import ipaddress
+import json
+import random
+import time
+import types
+from datetime import datetime, timezone
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+from urllib.parse import urlencode
+from urllib.request import getproxies
+
+import httpx
+from pydantic import BaseModel, RootModel
+
+from .generated.models import CreateEntitiesAndRelationshipsSchema
+
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, fall back to the stdlib json module
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Statuses after which idempotent requests are retried
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Errors after which idempotent requests are retried (the connection dropped)
+_RETRY_ERRORS = (httpx.NetworkError, httpx.RemoteProtocolError)
+
+# API endpoint paths. Paths of single objects are completed with
+# f"{prefix}{id}/", which is cheaper than a bound str.format
+_PATH_CREATE_REPORT = "/api/v1/create_report/"
+_PATH_REPORTS = "/api/v1/report/"
+_PATH_CREATE_DECISION = "/api/v1/create_decision/"
+_PATH_DECISIONS = "/api/v1/decisions/"
+_PATH_APPEALS = "/api/v1/appeal/"
+_PATH_GRAPH = "/api/v1/graph/"
+_PATH_GRAPH_SCHEMA = "/api/v1/graph/schema/"
+_PATH_EVENT = "/api/v2/workflows/event/"
+_PATH_EVENT_SYNC = "/api/v2/workflows/event/sync/"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _is_ip_address(hostname: str) -> bool:
+    try:
+        ipaddress.ip_address(hostname.split("/")[0])
+    except ValueError:
+        return False
+    return True
+
+
+def _environment_proxies() -> Dict[str, Optional[str]]:
+    """Return the proxies configured in the environment, as httpx reads them.
+
+    Mirrors httpx's own (private) parsing of HTTP_PROXY, HTTPS_PROXY,
+    ALL_PROXY and NO_PROXY, following curl's NO_PROXY rules.
+
+    Returns:
+        Proxy URL per httpx mount pattern, None for hosts not to proxy
+    """
+    proxy_info = getproxies()
+    mounts: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxy_info.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+
+    for hostname in (host.strip() for host in proxy_info.get("no", "").split(",")):
+        if hostname == "*":
+            return {}
+        if not hostname:
+            continue
+        if "://" in hostname:
+            mounts[hostname] = None
+        elif _is_ip_address(hostname):
+            # IPv6 addresses are bracketed in URLs
+            host = f"[{hostname}]" if ":" in hostname else hostname
+            mounts[f"all://{host}"] = None
+        elif hostname.lower() == "localhost":
+            mounts[f"all://{hostname}"] = None
+        else:
+            mounts[f"all://*{hostname}"] = None
+    return mounts
+
+
+def _to_json_bytes(schema: BaseModel) -> bytes:
+    """Serialize a model to JSON bytes in a single pydantic-core pass.
+
+    Equivalent to ``model_dump(mode="json", exclude_none=True)`` followed by
+    a JSON dump, without materializing the intermediate dict.
+    """
+    return schema.__pydantic_serializer__.to_json(schema, exclude_none=True)
+
+
+def _query_value(value: Any) -> Any:
+    """Encode booleans in query strings the way httpx does."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _converter(annotation: Any) -> Callable[[Any], Any]:
+    """Return a function turning raw JSON data into ``annotation`` without validation.
+
+    Only model containers are rebuilt (models, lists, dicts and optionals of
+    models). Scalars are passed through untouched, and unions between several
+    models are left as raw data since picking a member requires validation.
+    """
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        return _converter(get_args(annotation)[0])
+
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return _identity
+        inner = _converter(members[0])
+        if inner is _identity:
+            return _identity
+        return lambda value: None if value is None else inner(value)
+
+    if origin is list:
+        (item_type,) = get_args(annotation) or (Any,)
+        item = _converter(item_type)
+        if item is _identity:
+            return _identity
+        return lambda value: (
+            [item(v) for v in value] if isinstance(value, list) else value
+        )
+
+    if origin is dict:
+        args = get_args(annotation)
+        item = _converter(args[1]) if args else _identity
+        if item is _identity:
+            return _identity
+        return lambda value: (
+            {k: item(v) for k, v in value.items()} if isinstance(value, dict) else value
+        )
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return functools.partial(_construct, annotation)
+
+    return _identity
+
+
+@functools.lru_cache(maxsize=None)
+def _field_converters(
+    model: Type[BaseModel],
+) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """Return the fields of ``model`` that need converting, with their converters."""
+    converters = (
+        (name, _converter(field.annotation))
+        for name, field in model.model_fields.items()
+    )
+    return tuple((name, conv) for name, conv in converters if conv is not _identity)
+
+
+def _construct(model: Type[ModelT], data: Any) -> ModelT:
+    """Recursively build ``model`` from trusted data using ``model_construct``."""
+    if issubclass(model, RootModel):
+        root = model.model_fields["root"].annotation
+        return model.model_construct(_converter(root)(data))
+    if not isinstance(data, dict):
+        return data
+
+    values = dict(data)
+    for name, convert in _field_converters(model):
+        if name in values:
+            values[name] = convert(values[name])
+    return model.model_construct(**values)
+
+
+def _models_in(annotation: Any) -> Iterator[Type[BaseModel]]:
+    """Yield the model classes referenced by a type annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _models_in(arg)
+
+
+# Models already prepared by _warm_up
+_warmed: Set[Type[BaseModel]] = set()
+
+
+def _warm_up(models: Iterable[Type[BaseModel]]) -> None:
+    """Prepare response models so the first request does not pay for it.
+
+    Finishes any deferred schema build and precomputes the ``model_construct``
+    plans of the models and every model nested in them. Each model is only
+    processed once per process.
+
+    Args:
+        models: Response model classes
+    """
+    stack = [model for model in models if model not in _warmed]
+    while stack:
+        model = stack.pop()
+        if model in _warmed:
+            continue
+        _warmed.add(model)
+
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        _field_converters(model)
+        for field in model.model_fields.values():
+            stack.extend(_models_in(field.annotation))
+
+
+def _build(model: Type[ModelT], data: Any, validate: bool) -> ModelT:
+    """Build a response model from decoded JSON data.
+
+    With ``validate`` set the data goes through ``model_validate`` as usual.
+    Otherwise the model (and nested models) are assembled with
+    ``model_construct``, skipping validation entirely. That is only safe for
+    data coming from a trusted server: no type coercion happens, so e.g.
+    datetimes and enums stay as the raw JSON strings.
+
+    Args:
+        model: Pydantic model class to build
+        data: Decoded JSON data
+        validate: Whether to run Pydantic validation
+
+    Returns:
+        Model instance
+    """
+    if validate:
+        return model.model_validate(data)
+    return _construct(model, data)
 
 
 class BaseCinderClient:
     """Base class with shared functionality for Cinder API clients."""
 
+    # Response models returned by the client, prepared at construction
+    _RESPONSE_MODELS: Tuple[Type[BaseModel], ...] = ()
+
+    # Connection pool defaults, for limits not given to the constructor
+    _DEFAULT_LIMITS = httpx.Limits(
+        max_connections=1000,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0,
+    )
+
+    # Exponential backoff between retries: base delay and cap, in seconds.
+    # Retry-After delays longer than the maximum are not waited for
+    _RETRY_BACKOFF = 0.1
+    _RETRY_BACKOFF_CAP = 5.0
+    _RETRY_AFTER_MAX = 60.0
+
+    # httpx client options that configure the transport, forwarded to the
+    # transport built for connect retries
+    _TRANSPORT_OPTIONS = ("verify", "cert", "trust_env", "http1", "http2", "limits")
+
+    # Set on clients shared by get_client() and get_sync_client(), which
+    # ignore close() as other callers may be using them
+    _shared = False
+
+    # Success statuses returned by the API. Checking them first keeps
+    # raise_for_status off the common path
+    _OK_STATUSES = frozenset({200, 201, 202})
+
+    # Cheap endpoint probed by warmup()
+    _WARMUP_PATH = _PATH_GRAPH_SCHEMA
+
     def __init__(
         self,
         base_url: str,
         token: str,
         timeout: float = 30.0,
+        validate_responses: bool = True,
+        fast_lists: bool = False,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        schema_cache_ttl: float = 300.0,
+        max_retries: int = 2,
+        connect_retries: int = 2,
         **kwargs: Any,
     ):
         """Initialize the base client.
@@ -18,39 +327,326 @@ class BaseCinderClient:
             base_url: Base URL for the Cinder API
             token: API authentication token
             timeout: Request timeout in seconds
+            validate_responses: Validate API responses with Pydantic. When False,
+                responses are trusted and built without validation (faster, but
+                values are not coerced, e.g. datetimes remain strings)
+            fast_lists: Decode list endpoint pages with msgspec into lightweight
+                structs instead of Pydantic models. Requires msgspec
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            schema_cache_ttl: Seconds the graph schema is served from memory
+                before being fetched again. 0 always fetches it
+            max_retries: Number of times idempotent GET requests are retried
+                after a 429, 502, 503 or 504 response or a dropped connection
+            connect_retries: Number of times connecting is retried, for any
+                request. Ignored when a transport or a ``proxy`` is given
             **kwargs: Additional arguments passed to httpx client
         """
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
+        self._validate = validate_responses
+        self.max_retries = max_retries
+        self.connect_retries = connect_retries
+        _warm_up(self._RESPONSE_MODELS)
 
-        # Prepare headers
-        self.headers = kwargs.pop("headers", {})
-        self.headers.setdefault("Authorization", f"Bearer {token}")
-        self.headers.setdefault("Content-Type", "application/json")
+        # Last graph schema fetched, as (time.monotonic() timestamp, schema),
+        # and its ETag
+        self.schema_cache_ttl = schema_cache_ttl
+        self._schema_cache: Optional[Tuple[float, Any]] = None
+        self._schema_etag: Optional[str] = None
+
+        self._fast_decoders: Dict[Type[BaseModel], Any] = {}
+        if fast_lists:
+            try:
+                from ._fast_schemas import DECODERS
+            except ImportError as exc:
+                raise ImportError(
+                    "fast_lists requires the msgspec package: pip install 'cinder[fast]'"
+                ) from exc
+            self._fast_decoders = DECODERS
+
+        # Prepare headers once; user supplied headers take precedence and the
+        # caller's mapping is left untouched
+        self.headers = httpx.Headers(
+            {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                **kwargs.pop("headers", {}),
+            }
+        )
+
+        defaults = self._DEFAULT_LIMITS
+        self.limits = httpx.Limits(
+            max_connections=(
+                defaults.max_connections if max_connections is None else max_connections
+            ),
+            max_keepalive_connections=(
+                defaults.max_keepalive_connections
+                if max_keepalive_connections is None
+                else max_keepalive_connections
+            ),
+            keepalive_expiry=(
+                defaults.keepalive_expiry if keepalive_expiry is None else keepalive_expiry
+            ),
+        )
 
         self.extra_kwargs = kwargs
 
-    def _build_params(
+    def _transport_kwargs(
+        self, client_kwargs: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the arguments of a transport retrying connections.
+
+        Args:
+            client_kwargs: Arguments of the httpx client
+
+        Returns:
+            Arguments for the httpx transport, or None when a transport was
+            given or connect retries are disabled
+        """
+        if "transport" in client_kwargs or not self.connect_retries:
+            return None
+        return {
+            "retries": self.connect_retries,
+            **{
+                name: client_kwargs[name]
+                for name in self._TRANSPORT_OPTIONS
+                if name in client_kwargs
+            },
+        }
+
+    def _proxy_mounts(
         self,
+        client_kwargs: Dict[str, Any],
+        transport_kwargs: Dict[str, Any],
+        transport_class: Callable[..., Any],
+    ) -> Dict[str, Any]:
+        """Return the mounts routing requests through environment proxies.
+
+        httpx only honours HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY
+        when it builds the transport itself, so clients given the transport
+        from :meth:`_transport_kwargs` mount the proxies explicitly, with the
+        same transport options. Mounts given by the caller win.
+
+        Args:
+            client_kwargs: Arguments of the httpx client
+            transport_kwargs: Arguments of the client's transport
+            transport_class: httpx transport class to build
+
+        Returns:
+            Mounts for the httpx client, empty when none are needed
+        """
+        mounts: Dict[str, Any] = {}
+        if client_kwargs.get("trust_env", True) and client_kwargs.get("proxy") is None:
+            mounts = {
+                pattern: (
+                    None if url is None else transport_class(proxy=url, **transport_kwargs)
+                )
+                for pattern, url in _environment_proxies().items()
+            }
+        if mounts and client_kwargs.get("mounts"):
+            mounts.update(client_kwargs["mounts"])
+        return mounts
+
+    def _retry_delay(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """Return the number of seconds to wait before retrying a request.
+
+        Args:
+            attempt: Number of retries already made
+            response: Response received, None if the connection dropped
+
+        Returns:
+            Delay before the next attempt, or None if the request should not
+            be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is not None:
+            if response.status_code not in _RETRY_STATUSES:
+                return None
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self._RETRY_AFTER_MAX else None
+        backoff = min(self._RETRY_BACKOFF_CAP, self._RETRY_BACKOFF * 2**attempt)
+        return backoff * random.uniform(0.5, 1.5)
+
+    def invalidate_schema_cache(self) -> None:
+        """Forget the cached graph schema, so the next call fetches it again."""
+        self._schema_cache = None
+        self._schema_etag = None
+
+    def _cached_schema(self) -> Any:
+        """Return the cached graph schema if still fresh, None otherwise."""
+        if self._schema_cache is not None:
+            fetched_at, schema = self._schema_cache
+            if time.monotonic() - fetched_at < self.schema_cache_ttl:
+                return schema
+        return None
+
+    def _schema_headers(self) -> Dict[str, str]:
+        """Return the headers revalidating the cached graph schema, if any."""
+        if self._schema_cache is not None and self._schema_etag is not None:
+            return {"If-None-Match": self._schema_etag}
+        return {}
+
+    def _store_schema(self, schema: ModelT, etag: Optional[str]) -> ModelT:
+        """Cache a freshly fetched or revalidated graph schema.
+
+        Args:
+            schema: Graph schema
+            etag: ETag of the response, if any
+
+        Returns:
+            The schema
+        """
+        self._schema_cache = (time.monotonic(), schema)
+        # Replaced even when missing: a stale ETag must not revalidate a
+        # schema it was never sent with
+        self._schema_etag = etag
+        return schema
+
+    def _dumps(self, schema: Union[BaseModel, bytes]) -> bytes:
+        """Serialize a request model to a JSON body.
+
+        Args:
+            schema: Request model to serialize, or an already encoded body
+
+        Returns:
+            JSON encoded body, with None values left out. Bytes are taken
+            as an already encoded body and returned as is
+        """
+        if isinstance(schema, bytes):
+            return schema
+        return _to_json_bytes(schema)
+
+    def _loads(self, content: bytes) -> Any:
+        """Parse a JSON response body.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Decoded JSON data
+        """
+        return _json_loads(content)
+
+    def _parse(self, model: Type[ModelT], content: bytes) -> ModelT:
+        """Build a response model from a raw response body.
+
+        With validation on, the body is parsed and validated in a single
+        pydantic-core pass, without an intermediate dict. The model's core
+        validator is called directly, skipping the model_validate_json wrapper
+        (significant on small responses).
+
+        Args:
+            model: Pydantic model class to build
+            content: Raw response body
+
+        Returns:
+            Model instance
+        """
+        if self._validate:
+            return model.__pydantic_validator__.validate_json(content)
+        return _construct(model, self._loads(content))
+
+    def _build_page(self, model: Type[BaseModel], content: bytes) -> Any:
+        """Build a list endpoint page from a raw response body.
+
+        Args:
+            model: Pydantic page model of the endpoint
+            content: Raw response body
+
+        Returns:
+            The page model, or its msgspec mirror when fast_lists is enabled
+        """
+        decoder = self._fast_decoders.get(model)
+        if decoder is not None:
+            return decoder.decode(content)
+        return self._parse(model, content)
+
+    @staticmethod
+    def _graph_body(
+        entities: Optional[list[Any]],
+        relationships: Optional[list[Any]],
+    ) -> CreateEntitiesAndRelationshipsSchema:
+        """Build the request body of upserts.
+
+        Items that are already models are not validated again. Plain dicts
+        go through validation, like any other request field.
+
+        Args:
+            entities: Entities to upsert
+            relationships: Relationships to upsert
+
+        Returns:
+            Request model to serialize
+        """
+        items = [*(entities or ()), *(relationships or ())]
+        if all(isinstance(item, BaseModel) for item in items):
+            build = CreateEntitiesAndRelationshipsSchema.model_construct
+        else:
+            build = CreateEntitiesAndRelationshipsSchema
+        return build(entities=entities, relationships=relationships)
+
+    @staticmethod
+    def _build_query(
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         **extra_params: Any,
-    ) -> Dict[str, Any]:
-        """Build query parameters for list endpoints.
+    ) -> str:
+        """Build the query string of list endpoints.
+
+        The query is encoded here, in sorted key order, rather than by httpx
+        from a params dict, which is noticeably slower in pagination loops.
+        Values are encoded as httpx would: parameters set to None are left
+        out, booleans become ``true``/``false`` and lists repeat the key.
 
         Args:
             limit: Maximum number of results
             offset: Number of results to skip
             **extra_params: Additional parameters
 
+        Returns:
+            Query string to append to the path, including the leading ``?``,
+            or an empty string without parameters
+        """
+        extra_params["limit"] = limit
+        extra_params["offset"] = offset
+        items = []
+        for key, value in sorted(extra_params.items()):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                items.extend((key, _query_value(item)) for item in value)
+            else:
+                items.append((key, _query_value(value)))
+        return f"?{urlencode(items)}" if items else ""
+
+    @staticmethod
+    def _filter_params(
+        filters: Optional[BaseModel], extra_params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the query parameters of structured filters.
+
+        Iterators compute them once and reuse them for every page.
+
+        Args:
+            filters: Structured filters, fields set to None are left out
+            extra_params: Additional parameters, overridden by ``filters``
+
         Returns:
             Dictionary of query parameters
         """
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        params.update(extra_params)
+        params = {key: value for key, value in extra_params.items() if value is not None}
+        if filters is not None:
+            params.update(
+                filters.__pydantic_serializer__.to_python(
+                    filters, mode="json", exclude_none=True
+                )
+            )
         return params
@@ -0,0 +1,124 @@
+"""Buffered report submission for the async client."""
+import asyncio
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from .generated.models import CreateReportSchema, Report
+
+if TYPE_CHECKING:
+    from .client import CinderClient
+
+
+class ReportBatcher:
+    """Buffer reports and send them in batches.
+
+    Reports added with :meth:`add` are queued and sent together, with
+    :meth:`CinderClient.create_reports`, once ``max_batch`` reports are
+    waiting or the oldest one has waited ``max_wait`` seconds. This lets many
+    producers submit reports one at a time while requests go out in
+    concurrent waves.
+
+    Example:
+        ```python
+        async with client, ReportBatcher(client) as batcher:
+            futures = [await batcher.add(report) for report in reports]
+        created = [future.result() for future in futures]
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "CinderClient",
+        max_batch: int = 100,
+        max_wait: float = 0.05,
+        max_concurrency: int = 16,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            client: Client used to send the reports
+            max_batch: Number of queued reports triggering a flush
+            max_wait: Maximum number of seconds a report waits before being sent
+            max_concurrency: Maximum number of concurrent requests per flush
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+        self._queue: List[Tuple[CreateReportSchema, "asyncio.Future[Report]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: "set[asyncio.Task[None]]" = set()
+
+    async def __aenter__(self) -> "ReportBatcher":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit, sending any queued reports."""
+        await self.flush()
+
+    async def add(self, report: CreateReportSchema) -> "asyncio.Future[Report]":
+        """Queue a report to be created.
+
+        Args:
+            report: Report data to create
+
+        Returns:
+            Future resolving to the created report, or raising the error of
+            its request
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Report]" = loop.create_future()
+        self._queue.append((report, future))
+
+        if len(self._queue) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._start_flush)
+        return future
+
+    async def flush(self) -> None:
+        """Send the queued reports and wait for every pending batch."""
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+
+        batch, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._send(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _send(
+        self, batch: List[Tuple[CreateReportSchema, "asyncio.Future[Report]"]]
+    ) -> None:
+        try:
+            results = await self.client.create_reports(
+                [report for report, _ in batch],
+                max_concurrency=self.max_concurrency,
+            )
+        except BaseException as exc:
+            # Cancelled while sending: fail the whole batch
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+
+        if len(results) != len(batch):
+            # Results cannot be matched to reports: fail the whole batch
+            # rather than leave some futures pending forever
+            error = ValueError(f"Expected {len(batch)} results, got {len(results)}")
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
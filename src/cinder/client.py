@@ -1,16 +1,53 @@
 """Cinder API client wrapper."""
 
+import asyncio
+import contextlib
+import functools
 import os
-from typing import Any, Optional
+import threading
+import types
+import weakref
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
-
-from .base_client import BaseCinderClient
+from pydantic import BaseModel
+
+from .base_client import (
+    _PATH_APPEALS,
+    _PATH_CREATE_DECISION,
+    _PATH_CREATE_REPORT,
+    _PATH_DECISIONS,
+    _PATH_EVENT,
+    _PATH_EVENT_SYNC,
+    _PATH_GRAPH,
+    _PATH_GRAPH_SCHEMA,
+    _PATH_REPORTS,
+    _RETRY_ERRORS,
+    _RETRY_STATUSES,
+    BaseCinderClient,
+    _build,
+)
 from .generated.models import (
     Appeal,
     CreateDecisionSchema,
     CreateEntitiesAndRelationshipsResponseSchema,
-    CreateEntitiesAndRelationshipsSchema,
     CreateReportSchema,
     CustomerEvent,
     DecisionFilter,
@@ -25,6 +62,56 @@ from .generated.models import (
     StatusOkResponse,
     WorkflowResult,
 )
+from .transports import AiohttpTransport
+
+PageT = TypeVar("PageT", PagedReport, PagedDecisionSchema, PagedAppeal)
+ResultT = TypeVar("ResultT")
+
+
+class _AsyncByteReader:
+    """Minimal async file-like object over an async byte iterator, for ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0), which must not consume data
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def _gather_limited(
+    aws: Iterable[Awaitable[ResultT]], concurrency: int
+) -> list[Union[ResultT, BaseException]]:
+    """Await ``aws`` with at most ``concurrency`` running at once.
+
+    Returns the results in order, with exceptions returned rather than raised.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(aw: Awaitable[ResultT]) -> ResultT:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
+
+
+# Connection pool defaults, sized for high-concurrency async workloads
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=500,
+    keepalive_expiry=30.0,
+)
+
+# Clients shared by get_client(), by event loop, then by (base_url, token,
+# constructor arguments). HTTP connections belong to a loop, so a client is
+# never shared between loops; entries go away with their loop
+_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, "
+    "Dict[Tuple[str, str, FrozenSet[Tuple[str, Any]]], CinderClient]]"
+) = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
 
 
 class CinderClient(BaseCinderClient):
@@ -49,11 +136,47 @@ class CinderClient(BaseCinderClient):
         ```
     """
 
+    _RESPONSE_MODELS = (
+        Report,
+        PagedReport,
+        DecisionSchema,
+        PagedDecisionSchema,
+        Appeal,
+        PagedAppeal,
+        SchemaResponse,
+        CreateEntitiesAndRelationshipsResponseSchema,
+        StatusOkResponse,
+        WorkflowResult,
+    )
+
+    # Response models for send_event_sync by success status code. Other
+    # statuses go through raise_for_status, then WorkflowResult
+    _SYNC_EVENT_DISPATCH: ClassVar[Mapping[int, Type[BaseModel]]] = types.MappingProxyType(
+        {
+            200: WorkflowResult,
+            201: WorkflowResult,
+            202: StatusOkResponse,
+        }
+    )
+
+    _DEFAULT_LIMITS = DEFAULT_LIMITS
+
+    # Size in bytes above which list pages are parsed in a worker thread
+    _OFFLOAD_THRESHOLD = 64 * 1024
+
     def __init__(
         self,
         base_url: str,
         token: str,
         timeout: float = 30.0,
+        validate_responses: bool = True,
+        fast_lists: bool = False,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        schema_cache_ttl: float = 300.0,
+        max_retries: int = 2,
+        connect_retries: int = 2,
         **kwargs: Any,
     ):
         """Initialize the Cinder API client.
@@ -62,17 +185,63 @@ class CinderClient(BaseCinderClient):
             base_url: Base URL for the Cinder API (e.g., "https://api.example.com")
             token: API authentication token
             timeout: Request timeout in seconds (default: 30.0)
-            **kwargs: Additional arguments passed to httpx.AsyncClient
+            validate_responses: Validate API responses with Pydantic (default: True).
+                Set to False to skip validation for a trusted server, which is
+                considerably faster on large responses but does not coerce values
+            fast_lists: Decode list_* pages with msgspec into lightweight structs
+                instead of Pydantic models (default: False). Requires msgspec;
+                call ``to_model()`` on an item to get its Pydantic model
+            max_connections: Maximum number of concurrent connections
+                (default: 1000)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive (default: 500)
+            keepalive_expiry: Seconds an idle connection is kept alive (default: 30.0)
+            schema_cache_ttl: Seconds get_graph_schema serves the schema from
+                memory before fetching it again (default: 300.0). 0 always
+                fetches it, revalidating with the ETag when the server sends one
+            max_retries: Number of times GET requests are retried after a 429,
+                502, 503 or 504 response or a dropped connection, with
+                exponential backoff or as told by Retry-After (default: 2)
+            connect_retries: Number of times connecting is retried (default: 2).
+                Ignored when a transport or a ``proxy`` is given
+            **kwargs: Additional arguments passed to httpx.AsyncClient. By default
+                HTTP/2 is enabled; pass ``http2`` to override, or ``limits`` to
+                replace the pool limits above. Pass a ``transport`` built with
+                build_async_transport() to share a connection pool between
+                clients. Setting the CINDER_TRANSPORT environment variable to
+                "aiohttp" sends requests through AiohttpTransport
         """
-        super().__init__(base_url, token, timeout, **kwargs)
+        super().__init__(
+            base_url,
+            token,
+            timeout,
+            validate_responses,
+            fast_lists,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            schema_cache_ttl,
+            max_retries,
+            connect_retries,
+            **kwargs,
+        )
 
-        # Create async HTTP client
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=self.timeout,
+        # The async HTTP client is created on first use, inside the event loop
+        # that will drive it (see _get_client)
+        self._client_kwargs = {
+            "base_url": self.base_url,
+            "headers": self.headers,
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": True,
             **self.extra_kwargs,
-        )
+        }
+        use_aiohttp = os.environ.get("CINDER_TRANSPORT") == "aiohttp"
+        if use_aiohttp and "transport" not in self._client_kwargs:
+            self._client_kwargs["transport"] = AiohttpTransport(
+                limit=self._client_kwargs["limits"].max_connections
+            )
+        self.client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self) -> "CinderClient":
         """Async context manager entry."""
@@ -83,18 +252,96 @@ class CinderClient(BaseCinderClient):
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client.
+
+        The client can still be used afterwards: a new HTTP client is created
+        on the next request. Clients shared by :func:`get_client` are left
+        open, as other tasks may be using them.
+        """
+        if not self._shared:
+            await self._close()
+
+    async def _close(self) -> None:
+        if self.client is not None:
+            client, self.client = self.client, None
+            await client.aclose()
+
+    async def warmup(self, connections: int = 4) -> None:
+        """Open connections ahead of the first real requests.
+
+        Sends ``connections`` concurrent HEAD requests so the TCP and TLS
+        handshakes happen now rather than on the first requests that matter,
+        e.g. during application startup. Responses and errors are ignored.
+        With HTTP/2, concurrent requests share a single connection.
+
+        Args:
+            connections: Number of concurrent probe requests
+        """
+        client = self._get_client()
+        await asyncio.gather(
+            *(client.head(self._WARMUP_PATH) for _ in range(connections)),
+            return_exceptions=True,
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client, creating it on first use."""
+        if self.client is None:
+            client_kwargs = self._client_kwargs
+            transport_kwargs = self._transport_kwargs(client_kwargs)
+            if transport_kwargs is not None:
+                client_kwargs = {
+                    **client_kwargs,
+                    "transport": httpx.AsyncHTTPTransport(**transport_kwargs),
+                }
+                mounts = self._proxy_mounts(
+                    client_kwargs, transport_kwargs, httpx.AsyncHTTPTransport
+                )
+                if mounts:
+                    client_kwargs["mounts"] = mounts
+            self.client = httpx.AsyncClient(**client_kwargs)
+        return self.client
+
+    async def _build_page_async(self, model: Type[BaseModel], content: bytes) -> Any:
+        """Build a list endpoint page, off the event loop for large bodies.
+
+        Parsing a large page takes long enough to stall other requests, so
+        bodies over _OFFLOAD_THRESHOLD bytes are parsed in a worker thread.
+        Smaller ones are parsed inline, as a thread hop would cost more.
+        """
+        if len(content) > self._OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self._build_page, model, content)
+        return self._build_page(model, content)
+
+    async def _get(self, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an idempotent GET request, retrying transient failures."""
+        client = self._get_client()
+        attempt = 0
+        while True:
+            try:
+                response = await client.get(path, **kwargs)
+            except _RETRY_ERRORS:
+                delay = self._retry_delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                delay = self._retry_delay(attempt, response)
+                if delay is None:
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
 
     # -------------------------------------------------------------------------
     # Reports
     # -------------------------------------------------------------------------
 
-    async def create_report(self, report: CreateReportSchema) -> Report:
+    async def create_report(self, report: Union[CreateReportSchema, bytes]) -> Report:
         """Create a new report.
 
         Args:
-            report: Report data to create
+            report: Report data to create, or its already encoded
+                JSON body
 
         Returns:
             Created report
@@ -102,12 +349,13 @@ class CinderClient(BaseCinderClient):
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        response = await self.client.post(
-            "/api/v1/create_report/",
-            json=report.model_dump(mode="json", exclude_none=True),
+        response = await self._get_client().post(
+            _PATH_CREATE_REPORT,
+            content=self._dumps(report),
         )
-        response.raise_for_status()
-        return Report.model_validate(response.json())
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(Report, response.content)
 
     async def list_reports(
         self,
@@ -123,22 +371,24 @@ class CinderClient(BaseCinderClient):
             **filters: Additional filter parameters
 
         Returns:
-            Paginated list of reports
+            Paginated list of reports (msgspec structs when fast_lists is enabled)
         """
-        params = self._build_params(limit, offset, **filters)
-        response = await self.client.get("/api/v1/report/", params=params)
-        response.raise_for_status()
-        return PagedReport.model_validate(response.json())
+        query = self._build_query(limit, offset, **filters)
+        response = await self._get(f"{_PATH_REPORTS}{query}")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return await self._build_page_async(PagedReport, response.content)
 
     # -------------------------------------------------------------------------
     # Decisions
     # -------------------------------------------------------------------------
 
-    async def create_decision(self, decision: CreateDecisionSchema) -> DecisionSchema:
+    async def create_decision(self, decision: Union[CreateDecisionSchema, bytes]) -> DecisionSchema:
         """Create a new decision.
 
         Args:
-            decision: Decision data to create
+            decision: Decision data to create, or its already encoded
+                JSON body
 
         Returns:
             Created decision
@@ -146,12 +396,13 @@ class CinderClient(BaseCinderClient):
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        response = await self.client.post(
-            "/api/v1/create_decision/",
-            json=decision.model_dump(mode="json", exclude_none=True),
+        response = await self._get_client().post(
+            _PATH_CREATE_DECISION,
+            content=self._dumps(decision),
         )
-        response.raise_for_status()
-        return DecisionSchema.model_validate(response.json())
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(DecisionSchema, response.content)
 
     async def get_decision(self, decision_id: str) -> DecisionSchema:
         """Get a decision by ID.
@@ -165,9 +416,10 @@ class CinderClient(BaseCinderClient):
         Raises:
             httpx.HTTPStatusError: If the request fails or decision not found
         """
-        response = await self.client.get(f"/api/v1/decisions/{decision_id}/")
-        response.raise_for_status()
-        return DecisionSchema.model_validate(response.json())
+        response = await self._get(f"{_PATH_DECISIONS}{decision_id}/")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(DecisionSchema, response.content)
 
     async def list_decisions(
         self,
@@ -185,15 +437,70 @@ class CinderClient(BaseCinderClient):
             **extra_params: Additional query parameters
 
         Returns:
-            Paginated list of decisions
+            Paginated list of decisions (msgspec structs when fast_lists is enabled)
+        """
+        query = self._build_query(
+            limit, offset, **self._filter_params(filters, extra_params)
+        )
+
+        response = await self._get(f"{_PATH_DECISIONS}{query}")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return await self._build_page_async(PagedDecisionSchema, response.content)
+
+    async def stream_decisions(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        filters: Optional[DecisionFilter] = None,
+        **extra_params: Any,
+    ) -> AsyncIterator[DecisionSchema]:
+        """Stream the decisions of one page without buffering the whole response.
+
+        Takes the same arguments as :meth:`list_decisions`, but parses the
+        response incrementally and yields decisions one at a time, keeping
+        memory flat for large pages. Requires the ``ijson`` package.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            filters: Structured filters
+            **extra_params: Additional query parameters
+
+        Yields:
+            Decisions, in response order
+
+        Raises:
+            ImportError: If ijson is not installed
+            httpx.HTTPStatusError: If the request fails
+
+        Example:
+            ```python
+            async with client:
+                async for decision in client.stream_decisions(limit=1000):
+                    print(decision.uuid)
+            ```
         """
-        params = self._build_params(limit, offset, **extra_params)
-        if filters is not None:
-            params.update(filters.model_dump(mode="json", exclude_none=True))
+        # Imported on first use, to keep it out of the import of this module
+        try:
+            import ijson
+        except ImportError as exc:
+            raise ImportError(
+                "stream_decisions requires the ijson package: pip install 'cinder[stream]'"
+            ) from exc
+
+        query = self._build_query(
+            limit, offset, **self._filter_params(filters, extra_params)
+        )
 
-        response = await self.client.get("/api/v1/decisions/", params=params)
-        response.raise_for_status()
-        return PagedDecisionSchema.model_validate(response.json())
+        async with self._get_client().stream(
+            "GET", f"{_PATH_DECISIONS}{query}"
+        ) as response:
+            if response.status_code not in self._OK_STATUSES:
+                response.raise_for_status()
+            reader = _AsyncByteReader(response.aiter_bytes())
+            async for item in ijson.items(reader, "items.item", use_float=True):
+                yield _build(DecisionSchema, item, self._validate)
 
     # -------------------------------------------------------------------------
     # Appeals
@@ -211,9 +518,10 @@ class CinderClient(BaseCinderClient):
         Raises:
             httpx.HTTPStatusError: If the request fails or appeal not found
         """
-        response = await self.client.get(f"/api/v1/appeal/{appeal_id}/")
-        response.raise_for_status()
-        return Appeal.model_validate(response.json())
+        response = await self._get(f"{_PATH_APPEALS}{appeal_id}/")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(Appeal, response.content)
 
     async def list_appeals(
         self,
@@ -229,12 +537,13 @@ class CinderClient(BaseCinderClient):
             **filters: Additional filter parameters
 
         Returns:
-            Paginated list of appeals
+            Paginated list of appeals (msgspec structs when fast_lists is enabled)
         """
-        params = self._build_params(limit, offset, **filters)
-        response = await self.client.get("/api/v1/appeal/", params=params)
-        response.raise_for_status()
-        return PagedAppeal.model_validate(response.json())
+        query = self._build_query(limit, offset, **filters)
+        response = await self._get(f"{_PATH_APPEALS}{query}")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return await self._build_page_async(PagedAppeal, response.content)
 
     # -------------------------------------------------------------------------
     # Graph Schema
@@ -246,6 +555,11 @@ class CinderClient(BaseCinderClient):
         Returns the entity schemas and relationship schemas that define
         the structure of the Cinder graph.
 
+        The schema is cached for ``schema_cache_ttl`` seconds, and the same
+        instance is returned until then; see ``invalidate_schema_cache()``.
+        Once expired it is revalidated with the ETag of the previous response,
+        if any, so an unchanged schema is not downloaded again.
+
         Returns:
             Complete graph schema including entity and relationship schemas
 
@@ -260,9 +574,21 @@ class CinderClient(BaseCinderClient):
                 print(f"Found {len(schema.relationship_schemas)} relationship schemas")
             ```
         """
-        response = await self.client.get("/api/v1/graph/schema/")
-        response.raise_for_status()
-        return SchemaResponse.model_validate(response.json())
+        schema = self._cached_schema()
+        if schema is not None:
+            return schema
+
+        response = await self._get(
+            _PATH_GRAPH_SCHEMA, headers=self._schema_headers()
+        )
+        if response.status_code == 304 and self._schema_cache is not None:
+            # Unchanged since the cached copy was fetched
+            schema = self._schema_cache[1]
+        else:
+            if response.status_code not in self._OK_STATUSES:
+                response.raise_for_status()
+            schema = self._parse(SchemaResponse, response.content)
+        return self._store_schema(schema, response.headers.get("ETag"))
 
     # -------------------------------------------------------------------------
     # Graph (Entities & Relationships)
@@ -316,17 +642,14 @@ class CinderClient(BaseCinderClient):
                 )
             ```
         """
-        payload = CreateEntitiesAndRelationshipsSchema(
-            entities=entities,
-            relationships=relationships,
-        )
-        response = await self.client.post(
-            "/api/v1/graph/",
-            json=payload.model_dump(mode="json", exclude_none=True),
+        response = await self._get_client().post(
+            _PATH_GRAPH,
+            content=self._dumps(self._graph_body(entities, relationships)),
         )
-        response.raise_for_status()
-        return CreateEntitiesAndRelationshipsResponseSchema.model_validate(
-            response.json()
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(
+            CreateEntitiesAndRelationshipsResponseSchema, response.content
         )
 
     # -------------------------------------------------------------------------
@@ -362,12 +685,13 @@ class CinderClient(BaseCinderClient):
                 result = await client.send_event(event)
             ```
         """
-        response = await self.client.post(
-            "/api/v2/workflows/event/",
-            json=event.model_dump(mode="json", exclude_none=True),
+        response = await self._get_client().post(
+            _PATH_EVENT,
+            content=self._dumps(event),
         )
-        response.raise_for_status()
-        return StatusOkResponse.model_validate(response.json())
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(StatusOkResponse, response.content)
 
     async def send_event_sync(
         self, event: CustomerEvent
@@ -404,16 +728,264 @@ class CinderClient(BaseCinderClient):
                     print(f"Workflow executed: {result.path}")
             ```
         """
-        response = await self.client.post(
-            "/api/v2/workflows/event/sync/",
-            json=event.model_dump(mode="json", exclude_none=True),
+        response = await self._get_client().post(
+            _PATH_EVENT_SYNC,
+            content=self._dumps(event),
         )
-        response.raise_for_status()
+        # Response status determines which model to use, and doubles as the
+        # success check
+        model = self._SYNC_EVENT_DISPATCH.get(response.status_code)
+        if model is None:
+            response.raise_for_status()
+            model = WorkflowResult
+        return self._parse(model, response.content)
+
+    # -------------------------------------------------------------------------
+    # Bulk helpers
+    # -------------------------------------------------------------------------
 
-        # Check response status to determine which model to use
-        if response.status_code == 202:
-            return StatusOkResponse.model_validate(response.json())
-        return WorkflowResult.model_validate(response.json())
+    async def bulk_upsert(
+        self,
+        entities: Optional[Sequence[EntityApiSchema]] = None,
+        relationships: Optional[Sequence[RelationshipApiSchema]] = None,
+        chunk: int = 500,
+        concurrency: int = 16,
+    ) -> list[Union[CreateEntitiesAndRelationshipsResponseSchema, BaseException]]:
+        """Upsert many entities and relationships using concurrent requests.
+
+        Inputs are split into chunks of ``chunk`` items, each sent with
+        :meth:`upsert`, with at most ``concurrency`` requests in flight. All
+        entity chunks are sent before any relationship chunk, so relationships
+        never reference entities that have not been upserted yet.
+
+        Args:
+            entities: Entities to upsert
+            relationships: Relationships to upsert
+            chunk: Maximum number of items per request
+            concurrency: Maximum number of concurrent requests
+
+        Returns:
+            One result per request, in order: the upsert response, or the
+            exception raised by that request
+
+        Example:
+            ```python
+            async with client:
+                results = await client.bulk_upsert(entities=many_entities)
+                failed = [r for r in results if isinstance(r, Exception)]
+            ```
+        """
+        results: list[
+            Union[CreateEntitiesAndRelationshipsResponseSchema, BaseException]
+        ] = []
+        for name, items in (("entities", entities), ("relationships", relationships)):
+            if not items:
+                continue
+            results.extend(
+                await _gather_limited(
+                    (
+                        self.upsert(**{name: list(items[i : i + chunk])})
+                        for i in range(0, len(items), chunk)
+                    ),
+                    concurrency,
+                )
+            )
+        return results
+
+    async def create_reports(
+        self,
+        reports: Sequence[CreateReportSchema],
+        *,
+        max_concurrency: int = 16,
+    ) -> list[Union[Report, BaseException]]:
+        """Create many reports using concurrent requests.
+
+        The API creates one report per request, so reports are sent with
+        :meth:`create_report`, with at most ``max_concurrency`` requests in
+        flight.
+
+        Args:
+            reports: Reports to create
+            max_concurrency: Maximum number of concurrent requests
+
+        Returns:
+            One result per report, in order: the created report, or the
+            exception raised by its request
+        """
+        return await _gather_limited(
+            (self.create_report(report) for report in reports), max_concurrency
+        )
+
+    async def create_decisions(
+        self,
+        decisions: Sequence[CreateDecisionSchema],
+        *,
+        max_concurrency: int = 16,
+    ) -> list[Union[DecisionSchema, BaseException]]:
+        """Create many decisions using concurrent requests.
+
+        Decisions are sent with :meth:`create_decision`, with at most
+        ``max_concurrency`` requests in flight.
+
+        Args:
+            decisions: Decisions to create
+            max_concurrency: Maximum number of concurrent requests
+
+        Returns:
+            One result per decision, in order: the created decision, or the
+            exception raised by its request
+        """
+        return await _gather_limited(
+            (self.create_decision(decision) for decision in decisions),
+            max_concurrency,
+        )
+
+    async def iter_pages(
+        self,
+        fetch: Callable[..., Awaitable[PageT]],
+        page_size: int = 100,
+        prefetch: int = 4,
+    ) -> AsyncIterator[PageT]:
+        """Iterate over all pages of a list endpoint, fetching ahead.
+
+        Keeps up to ``prefetch`` page requests in flight, so the next pages are
+        already downloading while the current one is consumed. Pages are
+        yielded in order.
+
+        Args:
+            fetch: List method to call, e.g. ``client.list_reports`` (or a
+                ``functools.partial`` of one with filters applied). It is called
+                with ``limit`` and ``offset`` keyword arguments
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+
+        Yields:
+            Each page, in order
+
+        Example:
+            ```python
+            async with client:
+                async for page in client.iter_pages(client.list_reports):
+                    for report in page.items:
+                        print(report.reasoning)
+            ```
+        """
+        pending: deque[asyncio.Future[PageT]] = deque()
+        next_offset = 0
+
+        def schedule() -> None:
+            nonlocal next_offset
+            pending.append(
+                asyncio.ensure_future(fetch(limit=page_size, offset=next_offset))
+            )
+            next_offset += page_size
+
+        try:
+            for _ in range(max(prefetch, 1)):
+                schedule()
+
+            offset = 0
+            while pending:
+                page = await pending.popleft()
+                yield page
+
+                offset += page_size
+                if len(page.items) < page_size or offset >= page.count:
+                    break
+                # Pages past the reported count would come back empty
+                if next_offset < page.count:
+                    schedule()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def iter_reports(
+        self,
+        page_size: int = 100,
+        prefetch: int = 2,
+        **filters: Any,
+    ) -> AsyncIterator[Report]:
+        """Iterate over all reports, fetching the next pages in the background.
+
+        Args:
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+            **filters: Additional filter parameters
+
+        Yields:
+            Each report, in order
+        """
+        fetch = functools.partial(self.list_reports, **filters)
+        async for item in self._iter_items(fetch, page_size, prefetch):
+            yield item
+
+    async def iter_decisions(
+        self,
+        page_size: int = 100,
+        prefetch: int = 2,
+        filters: Optional[DecisionFilter] = None,
+        **extra_params: Any,
+    ) -> AsyncIterator[DecisionSchema]:
+        """Iterate over all decisions, fetching the next pages in the background.
+
+        Args:
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+            filters: Structured filters
+            **extra_params: Additional query parameters
+
+        Yields:
+            Each decision, in order
+
+        Example:
+            ```python
+            async with client:
+                async for decision in client.iter_decisions(page_size=500):
+                    await store(decision)
+            ```
+        """
+        # Filters are serialized once, not for every page
+        fetch = functools.partial(
+            self.list_decisions, **self._filter_params(filters, extra_params)
+        )
+        async for item in self._iter_items(fetch, page_size, prefetch):
+            yield item
+
+    async def iter_appeals(
+        self,
+        page_size: int = 100,
+        prefetch: int = 2,
+        **filters: Any,
+    ) -> AsyncIterator[Appeal]:
+        """Iterate over all appeals, fetching the next pages in the background.
+
+        Args:
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+            **filters: Additional filter parameters
+
+        Yields:
+            Each appeal, in order
+        """
+        fetch = functools.partial(self.list_appeals, **filters)
+        async for item in self._iter_items(fetch, page_size, prefetch):
+            yield item
+
+    async def _iter_items(
+        self,
+        fetch: Callable[..., Awaitable[PageT]],
+        page_size: int,
+        prefetch: int,
+    ) -> AsyncIterator[Any]:
+        # aclosing makes sure pending page requests are cancelled as soon as
+        # the caller stops iterating
+        async with contextlib.aclosing(
+            self.iter_pages(fetch, page_size, prefetch)
+        ) as pages:
+            async for page in pages:
+                for item in page.items:
+                    yield item
 
     # -------------------------------------------------------------------------
     # Generic request methods
@@ -443,11 +1015,81 @@ class CinderClient(BaseCinderClient):
             data = response.json()
             ```
         """
-        response = await self.client.request(method, path, **kwargs)
-        response.raise_for_status()
+        response = await self._get_client().request(method, path, **kwargs)
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return response
+
+    def build_request(self, method: str, path: str, **kwargs: Any) -> httpx.Request:
+        """Build a request to send later with :meth:`send_prepared`.
+
+        The request carries the client's base URL and headers, so the URL,
+        headers and query parameters are only encoded once even when the
+        request is sent many times.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path (will be appended to base_url)
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            Prepared request
+
+        Example:
+            ```python
+            request = client.build_request("GET", "/api/v1/graph/schema/")
+            for _ in range(10):
+                response = await client.send_prepared(request)
+            ```
+        """
+        return self._get_client().build_request(method, path, **kwargs)
+
+    async def send_prepared(self, request: httpx.Request) -> httpx.Response:
+        """Send a request built with :meth:`build_request`.
+
+        Args:
+            request: Prepared request. Its URL can be changed between sends
+                with ``request.url = request.url.copy_with(path=...)``
+
+        Returns:
+            HTTP response
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        response = await self._get_client().send(request)
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
         return response
 
 
+# Whether CINDER_USE_UVLOOP has already been looked at
+_uvloop_checked = False
+
+
+def _maybe_install_uvloop() -> None:
+    """Switch asyncio to uvloop's event loop policy when opted in.
+
+    Enabled by setting CINDER_USE_UVLOOP=1 and only considered once per
+    process. The policy applies to event loops created afterwards, so it is
+    best triggered (by a first get_client call) before asyncio.run. Nothing
+    happens if uvloop is not installed.
+    """
+    global _uvloop_checked
+    if _uvloop_checked:
+        return
+    _uvloop_checked = True
+
+    if os.environ.get("CINDER_USE_UVLOOP") != "1":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop not installed (or unsupported platform), keep the default loop
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def get_client(
     token: Optional[str] = None,
     base_url: Optional[str] = None,
@@ -458,10 +1100,22 @@ def get_client(
     This is a convenience function that reads configuration from environment
     variables if not provided explicitly.
 
+    Called from a running event loop, clients are shared per event loop and
+    (base_url, token, kwargs), so repeated calls reuse the same connection
+    pool. Shared clients ignore ``close()`` and ``async with`` exits, since
+    other tasks may be using them; their connections are dropped along with
+    their event loop. Called outside of an event loop, or with unhashable
+    kwargs (e.g. a headers dict), a new unshared client is returned, to be
+    closed by the caller. ``await get_client.cache_clear()`` closes and
+    forgets the clients shared in the running event loop.
+
+    Setting CINDER_USE_UVLOOP=1 makes the first call install uvloop's event
+    loop policy, if uvloop is installed.
+
     Args:
         token: API token. If not provided, reads from CINDER_API_TOKEN env var.
         base_url: Base URL for the API. If not provided, reads from CINDER_API_URL env var.
-        **kwargs: Additional arguments passed to CinderClient constructor.
+        **kwargs: Additional arguments passed to CinderClient constructor
 
     Returns:
         CinderClient instance configured with authentication.
@@ -472,16 +1126,16 @@ def get_client(
 
     Example:
         ```python
-        # Using environment variables
-        client = get_client()
-
-        # Or explicitly
-        client = get_client(
-            token="your-token",
-            base_url="https://api.example.com"
-        )
+        async def handler():
+            # Using environment variables
+            client = get_client()
+
+            # Or explicitly
+            client = get_client(
+                token="your-token",
+                base_url="https://api.example.com"
+            )
 
-        async with client:
             decisions = await client.list_decisions()
         ```
     """
@@ -499,8 +1153,33 @@ def get_client(
                 "Base URL must be provided via 'base_url' parameter or CINDER_API_URL environment variable"
             )
 
-    return CinderClient(
-        base_url=base_url,
-        token=token,
-        **kwargs,
-    )
+    _maybe_install_uvloop()
+
+    try:
+        loop = asyncio.get_running_loop()
+        key = (base_url, token, frozenset(kwargs.items()))
+    except (RuntimeError, TypeError):
+        # No loop to share the client in, or unhashable arguments that
+        # cannot be compared: don't share the client
+        return CinderClient(base_url=base_url, token=token, **kwargs)
+
+    with _clients_lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = CinderClient(
+                base_url=base_url, token=token, **kwargs
+            )
+            client._shared = True
+    return client
+
+
+async def _clear_clients() -> None:
+    """Close and forget the clients get_client() shared in the running event loop."""
+    with _clients_lock:
+        clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client._close()
+
+
+get_client.cache_clear = _clear_clients  # type: ignore[attr-defined]
@@ -1,15 +1,52 @@
 """Synchronous Cinder API client wrapper."""
+import atexit
+import contextlib
+import functools
 import os
-from typing import Any, Optional
+import threading
+import time
+import types
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
-
-from .base_client import BaseCinderClient
+from pydantic import BaseModel
+
+from .base_client import (
+    _PATH_APPEALS,
+    _PATH_CREATE_DECISION,
+    _PATH_CREATE_REPORT,
+    _PATH_DECISIONS,
+    _PATH_EVENT,
+    _PATH_EVENT_SYNC,
+    _PATH_GRAPH,
+    _PATH_GRAPH_SCHEMA,
+    _PATH_REPORTS,
+    _RETRY_ERRORS,
+    _RETRY_STATUSES,
+    BaseCinderClient,
+    _build,
+)
 from .generated.models import (
     Appeal,
     CreateDecisionSchema,
     CreateEntitiesAndRelationshipsResponseSchema,
-    CreateEntitiesAndRelationshipsSchema,
     CreateReportSchema,
     CustomerEvent,
     DecisionFilter,
@@ -25,6 +62,75 @@ from .generated.models import (
     WorkflowResult,
 )
 
+PageT = TypeVar("PageT", PagedReport, PagedDecisionSchema, PagedAppeal)
+
+
+# Connection pool defaults, sized for threaded use (e.g. one request per
+# Django worker thread) with long-lived keep-alive connections
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# Transport options of clients built with the default arguments, which share
+# a single transport
+_SHARED_TRANSPORT_KWARGS = {"retries": 2, "limits": DEFAULT_LIMITS, "http2": True}
+_shared_transport: Optional["_SharedTransport"] = None
+_shared_transport_lock = threading.Lock()
+
+# Clients shared by get_sync_client(), keyed by (base_url, token, constructor arguments)
+_clients: Dict[Tuple[str, str, FrozenSet[Tuple[str, Any]]], "SyncCinderClient"] = {}
+_clients_lock = threading.Lock()
+
+
+class _SharedTransport(httpx.HTTPTransport):
+    """Transport shared by every client with the default connection options.
+
+    Closing one of the clients leaves the transport open for the others; its
+    connections are closed at interpreter exit.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+def _get_transport(transport_kwargs: Dict[str, Any]) -> httpx.HTTPTransport:
+    """Return the transport of a client, sharing the one of default clients.
+
+    Clients with the default options share one connection pool (and DNS and
+    TLS session caches). Others get their own transport.
+    """
+    global _shared_transport
+    if transport_kwargs != _SHARED_TRANSPORT_KWARGS:
+        return httpx.HTTPTransport(**transport_kwargs)
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = _SharedTransport(**transport_kwargs)
+        return _shared_transport
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close the shared clients' connection pools at interpreter exit."""
+    for client in list(_clients.values()):
+        client._close()
+    if _shared_transport is not None:
+        httpx.HTTPTransport.close(_shared_transport)
+
+
+class _ByteReader:
+    """Minimal file-like object over a byte iterator, for ijson."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = iter(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0), which must not consume data
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
 
 class SyncCinderClient(BaseCinderClient):
     """Synchronous HTTP client for Cinder API.
@@ -49,11 +155,44 @@ class SyncCinderClient(BaseCinderClient):
         ```
     """
 
+    _RESPONSE_MODELS = (
+        Report,
+        PagedReport,
+        DecisionSchema,
+        PagedDecisionSchema,
+        Appeal,
+        PagedAppeal,
+        SchemaResponse,
+        CreateEntitiesAndRelationshipsResponseSchema,
+        StatusOkResponse,
+        WorkflowResult,
+    )
+
+    # Response models for send_event_sync by success status code. Other
+    # statuses go through raise_for_status, then WorkflowResult
+    _SYNC_EVENT_DISPATCH: ClassVar[Mapping[int, Type[BaseModel]]] = types.MappingProxyType(
+        {
+            200: WorkflowResult,
+            201: WorkflowResult,
+            202: StatusOkResponse,
+        }
+    )
+
+    _DEFAULT_LIMITS = DEFAULT_LIMITS
+
     def __init__(
         self,
         base_url: str,
         token: str,
         timeout: float = 30.0,
+        validate_responses: bool = True,
+        fast_lists: bool = False,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        schema_cache_ttl: float = 300.0,
+        max_retries: int = 2,
+        connect_retries: int = 2,
         **kwargs: Any,
     ):
         """Initialize the Cinder API client.
@@ -62,16 +201,62 @@ class SyncCinderClient(BaseCinderClient):
             base_url: Base URL for the Cinder API (e.g., "https://api.example.com")
             token: API authentication token
             timeout: Request timeout in seconds (default: 30.0)
-            **kwargs: Additional arguments passed to httpx.Client
+            validate_responses: Validate API responses with Pydantic (default: True).
+                Set to False to skip validation for a trusted server, which is
+                considerably faster on large responses but does not coerce values
+            fast_lists: Decode list_* pages with msgspec into lightweight structs
+                instead of Pydantic models (default: False). Requires msgspec;
+                call ``to_model()`` on an item to get its Pydantic model
+            max_connections: Maximum number of concurrent connections
+                (default: 64)
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive (default: 32)
+            keepalive_expiry: Seconds an idle connection is kept alive (default: 60.0)
+            schema_cache_ttl: Seconds get_graph_schema serves the schema from
+                memory before fetching it again (default: 300.0). 0 always
+                fetches it, revalidating with the ETag when the server sends one
+            max_retries: Number of times GET requests are retried after a 429,
+                502, 503 or 504 response or a dropped connection, with
+                exponential backoff or as told by Retry-After (default: 2)
+            connect_retries: Number of times connecting is retried (default: 2).
+                Ignored when a transport or a ``proxy`` is given
+            **kwargs: Additional arguments passed to httpx.Client. By default
+                HTTP/2 is enabled; pass ``http2`` to override, or ``limits`` to
+                replace the pool limits above. Clients keeping the default
+                connection options share one connection pool; pass a
+                ``transport`` built with build_transport() to share a pool
+                between clients with other options
         """
-        super().__init__(base_url, token, timeout, **kwargs)
+        super().__init__(
+            base_url,
+            token,
+            timeout,
+            validate_responses,
+            fast_lists,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            schema_cache_ttl,
+            max_retries,
+            connect_retries,
+            **kwargs,
+        )
 
         # Create sync HTTP client
+        client_kwargs = {"limits": self.limits, "http2": True, **self.extra_kwargs}
+        transport_kwargs = self._transport_kwargs(client_kwargs)
+        if transport_kwargs is not None:
+            client_kwargs["transport"] = _get_transport(transport_kwargs)
+            mounts = self._proxy_mounts(
+                client_kwargs, transport_kwargs, httpx.HTTPTransport
+            )
+            if mounts:
+                client_kwargs["mounts"] = mounts
         self.client = httpx.Client(
             base_url=self.base_url,
             headers=self.headers,
             timeout=self.timeout,
-            **self.extra_kwargs,
+            **client_kwargs,
         )
 
     def __enter__(self) -> "SyncCinderClient":
@@ -83,18 +268,63 @@ class SyncCinderClient(BaseCinderClient):
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client.
+
+        Clients shared by :func:`get_sync_client` are left open, as other
+        callers may be using them; they are closed at interpreter exit.
+        """
+        if not self._shared:
+            self._close()
+
+    def _close(self) -> None:
         self.client.close()
 
+    def warmup(self, connections: int = 4) -> None:
+        """Open connections ahead of the first real requests.
+
+        Sends ``connections`` concurrent HEAD requests from worker threads so
+        the TCP and TLS handshakes happen now rather than on the first
+        requests that matter, e.g. in Django's ``AppConfig.ready``. Responses
+        and errors are ignored. With HTTP/2, concurrent requests share a
+        single connection.
+
+        Args:
+            connections: Number of concurrent probe requests
+        """
+        # Leaving the executor waits for every probe; their errors are dropped
+        with ThreadPoolExecutor(max_workers=max(connections, 1)) as pool:
+            for _ in range(connections):
+                pool.submit(self.client.head, self._WARMUP_PATH)
+
+    def _get(self, path: str, **kwargs: Any) -> httpx.Response:
+        """Send an idempotent GET request, retrying transient failures."""
+        attempt = 0
+        while True:
+            try:
+                response = self.client.get(path, **kwargs)
+            except _RETRY_ERRORS:
+                delay = self._retry_delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                delay = self._retry_delay(attempt, response)
+                if delay is None:
+                    return response
+            attempt += 1
+            time.sleep(delay)
+
     # -------------------------------------------------------------------------
     # Reports
     # -------------------------------------------------------------------------
 
-    def create_report(self, report: CreateReportSchema) -> Report:
+    def create_report(self, report: Union[CreateReportSchema, bytes]) -> Report:
         """Create a new report.
 
         Args:
-            report: Report data to create
+            report: Report data to create, or its already encoded
+                JSON body
 
         Returns:
             Created report
@@ -103,11 +333,12 @@ class SyncCinderClient(BaseCinderClient):
             httpx.HTTPStatusError: If the request fails
         """
         response = self.client.post(
-            "/api/v1/create_report/",
-            json=report.model_dump(mode="json", exclude_none=True),
+            _PATH_CREATE_REPORT,
+            content=self._dumps(report),
         )
-        response.raise_for_status()
-        return Report.model_validate(response.json())
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(Report, response.content)
 
     def list_reports(
         self,
@@ -123,22 +354,24 @@ class SyncCinderClient(BaseCinderClient):
             **filters: Additional filter parameters
 
         Returns:
-            Paginated list of reports
+            Paginated list of reports (msgspec structs when fast_lists is enabled)
         """
-        params = self._build_params(limit, offset, **filters)
-        response = self.client.get("/api/v1/report/", params=params)
-        response.raise_for_status()
-        return PagedReport.model_validate(response.json())
+        query = self._build_query(limit, offset, **filters)
+        response = self._get(f"{_PATH_REPORTS}{query}")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._build_page(PagedReport, response.content)
 
     # -------------------------------------------------------------------------
     # Decisions
     # -------------------------------------------------------------------------
 
-    def create_decision(self, decision: CreateDecisionSchema) -> DecisionSchema:
+    def create_decision(self, decision: Union[CreateDecisionSchema, bytes]) -> DecisionSchema:
         """Create a new decision.
 
         Args:
-            decision: Decision data to create
+            decision: Decision data to create, or its already encoded
+                JSON body
 
         Returns:
             Created decision
@@ -147,11 +380,12 @@ class SyncCinderClient(BaseCinderClient):
             httpx.HTTPStatusError: If the request fails
         """
         response = self.client.post(
-            "/api/v1/create_decision/",
-            json=decision.model_dump(mode="json", exclude_none=True),
+            _PATH_CREATE_DECISION,
+            content=self._dumps(decision),
         )
-        response.raise_for_status()
-        return DecisionSchema.model_validate(response.json())
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(DecisionSchema, response.content)
 
     def get_decision(self, decision_id: str) -> DecisionSchema:
         """Get a decision by ID.
@@ -165,9 +399,10 @@ class SyncCinderClient(BaseCinderClient):
         Raises:
             httpx.HTTPStatusError: If the request fails or decision not found
         """
-        response = self.client.get(f"/api/v1/decisions/{decision_id}/")
-        response.raise_for_status()
-        return DecisionSchema.model_validate(response.json())
+        response = self._get(f"{_PATH_DECISIONS}{decision_id}/")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(DecisionSchema, response.content)
 
     def list_decisions(
         self,
@@ -185,15 +420,68 @@ class SyncCinderClient(BaseCinderClient):
             **extra_params: Additional query parameters
 
         Returns:
-            Paginated list of decisions
+            Paginated list of decisions (msgspec structs when fast_lists is enabled)
+        """
+        query = self._build_query(
+            limit, offset, **self._filter_params(filters, extra_params)
+        )
+
+        response = self._get(f"{_PATH_DECISIONS}{query}")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._build_page(PagedDecisionSchema, response.content)
+
+    def stream_decisions(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        filters: Optional[DecisionFilter] = None,
+        **extra_params: Any,
+    ) -> Iterator[DecisionSchema]:
+        """Stream the decisions of one page without buffering the whole response.
+
+        Takes the same arguments as :meth:`list_decisions`, but parses the
+        response incrementally and yields decisions one at a time, keeping
+        memory flat for large pages. Requires the ``ijson`` package.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+            filters: Structured filters
+            **extra_params: Additional query parameters
+
+        Yields:
+            Decisions, in response order
+
+        Raises:
+            ImportError: If ijson is not installed
+            httpx.HTTPStatusError: If the request fails
+
+        Example:
+            ```python
+            with client:
+                for decision in client.stream_decisions(limit=1000):
+                    print(decision.uuid)
+            ```
         """
-        params = self._build_params(limit, offset, **extra_params)
-        if filters is not None:
-            params.update(filters.model_dump(mode="json", exclude_none=True))
+        # Imported on first use, to keep it out of the import of this module
+        try:
+            import ijson
+        except ImportError as exc:
+            raise ImportError(
+                "stream_decisions requires the ijson package: pip install 'cinder[stream]'"
+            ) from exc
+
+        query = self._build_query(
+            limit, offset, **self._filter_params(filters, extra_params)
+        )
 
-        response = self.client.get("/api/v1/decisions/", params=params)
-        response.raise_for_status()
-        return PagedDecisionSchema.model_validate(response.json())
+        with self.client.stream("GET", f"{_PATH_DECISIONS}{query}") as response:
+            if response.status_code not in self._OK_STATUSES:
+                response.raise_for_status()
+            reader = _ByteReader(response.iter_bytes())
+            for item in ijson.items(reader, "items.item", use_float=True):
+                yield _build(DecisionSchema, item, self._validate)
 
     # -------------------------------------------------------------------------
     # Appeals
@@ -211,9 +499,10 @@ class SyncCinderClient(BaseCinderClient):
         Raises:
             httpx.HTTPStatusError: If the request fails or appeal not found
         """
-        response = self.client.get(f"/api/v1/appeal/{appeal_id}/")
-        response.raise_for_status()
-        return Appeal.model_validate(response.json())
+        response = self._get(f"{_PATH_APPEALS}{appeal_id}/")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(Appeal, response.content)
 
     def list_appeals(
         self,
@@ -229,12 +518,13 @@ class SyncCinderClient(BaseCinderClient):
             **filters: Additional filter parameters
 
         Returns:
-            Paginated list of appeals
+            Paginated list of appeals (msgspec structs when fast_lists is enabled)
         """
-        params = self._build_params(limit, offset, **filters)
-        response = self.client.get("/api/v1/appeal/", params=params)
-        response.raise_for_status()
-        return PagedAppeal.model_validate(response.json())
+        query = self._build_query(limit, offset, **filters)
+        response = self._get(f"{_PATH_APPEALS}{query}")
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._build_page(PagedAppeal, response.content)
 
     # -------------------------------------------------------------------------
     # Graph Schema
@@ -246,6 +536,11 @@ class SyncCinderClient(BaseCinderClient):
         Returns the entity schemas and relationship schemas that define
         the structure of the Cinder graph.
 
+        The schema is cached for ``schema_cache_ttl`` seconds, and the same
+        instance is returned until then; see ``invalidate_schema_cache()``.
+        Once expired it is revalidated with the ETag of the previous response,
+        if any, so an unchanged schema is not downloaded again.
+
         Returns:
             Complete graph schema including entity and relationship schemas
 
@@ -260,9 +555,21 @@ class SyncCinderClient(BaseCinderClient):
                 print(f"Found {len(schema.relationship_schemas)} relationship schemas")
             ```
         """
-        response = self.client.get("/api/v1/graph/schema/")
-        response.raise_for_status()
-        return SchemaResponse.model_validate(response.json())
+        schema = self._cached_schema()
+        if schema is not None:
+            return schema
+
+        response = self._get(
+            _PATH_GRAPH_SCHEMA, headers=self._schema_headers()
+        )
+        if response.status_code == 304 and self._schema_cache is not None:
+            # Unchanged since the cached copy was fetched
+            schema = self._schema_cache[1]
+        else:
+            if response.status_code not in self._OK_STATUSES:
+                response.raise_for_status()
+            schema = self._parse(SchemaResponse, response.content)
+        return self._store_schema(schema, response.headers.get("ETag"))
 
     # -------------------------------------------------------------------------
     # Graph (Entities & Relationships)
@@ -316,17 +623,14 @@ class SyncCinderClient(BaseCinderClient):
                 )
             ```
         """
-        payload = CreateEntitiesAndRelationshipsSchema(
-            entities=entities,
-            relationships=relationships,
-        )
         response = self.client.post(
-            "/api/v1/graph/",
-            json=payload.model_dump(mode="json", exclude_none=True),
+            _PATH_GRAPH,
+            content=self._dumps(self._graph_body(entities, relationships)),
         )
-        response.raise_for_status()
-        return CreateEntitiesAndRelationshipsResponseSchema.model_validate(
-            response.json()
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(
+            CreateEntitiesAndRelationshipsResponseSchema, response.content
         )
 
     # -------------------------------------------------------------------------
@@ -363,11 +667,12 @@ class SyncCinderClient(BaseCinderClient):
             ```
         """
         response = self.client.post(
-            "/api/v2/workflows/event/",
-            json=event.model_dump(mode="json", exclude_none=True),
+            _PATH_EVENT,
+            content=self._dumps(event),
         )
-        response.raise_for_status()
-        return StatusOkResponse.model_validate(response.json())
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return self._parse(StatusOkResponse, response.content)
 
     def send_event_sync(self, event: CustomerEvent) -> WorkflowResult | StatusOkResponse:
         """Send an event to Cinder for synchronous processing.
@@ -403,15 +708,234 @@ class SyncCinderClient(BaseCinderClient):
             ```
         """
         response = self.client.post(
-            "/api/v2/workflows/event/sync/",
-            json=event.model_dump(mode="json", exclude_none=True),
+            _PATH_EVENT_SYNC,
+            content=self._dumps(event),
         )
-        response.raise_for_status()
+        # Response status determines which model to use, and doubles as the
+        # success check
+        model = self._SYNC_EVENT_DISPATCH.get(response.status_code)
+        if model is None:
+            response.raise_for_status()
+            model = WorkflowResult
+        return self._parse(model, response.content)
 
-        # Check response status to determine which model to use
-        if response.status_code == 202:
-            return StatusOkResponse.model_validate(response.json())
-        return WorkflowResult.model_validate(response.json())
+    # -------------------------------------------------------------------------
+    # Bulk helpers
+    # -------------------------------------------------------------------------
+
+    def create_reports(
+        self,
+        reports: Sequence[CreateReportSchema],
+        *,
+        max_concurrency: int = 16,
+    ) -> list[Union[Report, BaseException]]:
+        """Create many reports using concurrent requests.
+
+        The API creates one report per request, so reports are sent with
+        :meth:`create_report` from up to ``max_concurrency`` worker threads
+        sharing the client's connection pool.
+
+        Args:
+            reports: Reports to create
+            max_concurrency: Maximum number of concurrent requests
+
+        Returns:
+            One result per report, in order: the created report, or the
+            exception raised by its request
+        """
+        results: list[Union[Report, BaseException]] = []
+        with ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as pool:
+            futures = [pool.submit(self.create_report, report) for report in reports]
+            for future in futures:
+                error = future.exception()
+                results.append(future.result() if error is None else error)
+        return results
+
+    def map_get_decisions(
+        self, decision_ids: Iterable[str], max_workers: int = 16
+    ) -> list[DecisionSchema]:
+        """Get many decisions using concurrent requests.
+
+        The API returns one decision per request, so decisions are fetched
+        with :meth:`get_decision` from up to ``max_workers`` worker threads
+        sharing the client's connection pool. The threads only live for the
+        duration of the call, so concurrent calls never share them.
+
+        Args:
+            decision_ids: IDs of the decisions to get
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Decisions, in the order of ``decision_ids``
+
+        Raises:
+            httpx.HTTPStatusError: If a request fails (the first failure in
+                order is raised)
+        """
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+            return list(pool.map(self.get_decision, decision_ids))
+
+    def upsert_many(
+        self,
+        entities: Optional[Sequence[EntityApiSchema]] = None,
+        relationships: Optional[Sequence[RelationshipApiSchema]] = None,
+        chunk_size: int = 500,
+    ) -> list[CreateEntitiesAndRelationshipsResponseSchema]:
+        """Upsert many entities and relationships in chunks.
+
+        Inputs are split into chunks of ``chunk_size`` items, each sent with
+        :meth:`upsert` over the same connection. All entity chunks are sent
+        before any relationship chunk, so relationships never reference
+        entities that have not been upserted yet.
+
+        Args:
+            entities: Entities to upsert
+            relationships: Relationships to upsert
+            chunk_size: Maximum number of items per request
+
+        Returns:
+            One upsert response per request, in order
+
+        Raises:
+            httpx.HTTPStatusError: If a request fails. Chunks sent before it
+                have already been upserted
+        """
+        results = []
+        for name, items in (("entities", entities), ("relationships", relationships)):
+            if not items:
+                continue
+            for i in range(0, len(items), chunk_size):
+                results.append(self.upsert(**{name: list(items[i : i + chunk_size])}))
+        return results
+
+    def iter_pages(
+        self,
+        fetch: Callable[..., PageT],
+        page_size: int = 100,
+        prefetch: int = 1,
+    ) -> Iterator[PageT]:
+        """Iterate over all pages of a list endpoint, fetching ahead.
+
+        Up to ``prefetch`` next pages are requested from worker threads while
+        the current one is consumed. Pages are yielded in order.
+
+        Args:
+            fetch: List method to call, e.g. ``client.list_reports`` (or a
+                ``functools.partial`` of one with filters applied). It is called
+                with ``limit`` and ``offset`` keyword arguments
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+
+        Yields:
+            Each page, in order
+        """
+        pending: deque[Future[PageT]] = deque()
+        next_offset = 0
+
+        with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as pool:
+
+            def schedule() -> None:
+                nonlocal next_offset
+                pending.append(pool.submit(fetch, limit=page_size, offset=next_offset))
+                next_offset += page_size
+
+            try:
+                for _ in range(max(prefetch, 1)):
+                    schedule()
+
+                offset = 0
+                while pending:
+                    page = pending.popleft().result()
+                    yield page
+
+                    offset += page_size
+                    if len(page.items) < page_size or offset >= page.count:
+                        break
+                    # Pages past the reported count would come back empty
+                    if next_offset < page.count:
+                        schedule()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_reports(
+        self,
+        page_size: int = 100,
+        prefetch: int = 1,
+        **filters: Any,
+    ) -> Iterator[Report]:
+        """Iterate over all reports, fetching the next pages in the background.
+
+        Args:
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+            **filters: Additional filter parameters
+
+        Yields:
+            Each report, in order
+        """
+        fetch = functools.partial(self.list_reports, **filters)
+        return self._iter_items(fetch, page_size, prefetch)
+
+    def iter_decisions(
+        self,
+        page_size: int = 100,
+        prefetch: int = 1,
+        filters: Optional[DecisionFilter] = None,
+        **extra_params: Any,
+    ) -> Iterator[DecisionSchema]:
+        """Iterate over all decisions, fetching the next pages in the background.
+
+        Args:
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+            filters: Structured filters
+            **extra_params: Additional query parameters
+
+        Yields:
+            Each decision, in order
+
+        Example:
+            ```python
+            with client:
+                for decision in client.iter_decisions(page_size=500):
+                    store(decision)
+            ```
+        """
+        # Filters are serialized once, not for every page
+        fetch = functools.partial(
+            self.list_decisions, **self._filter_params(filters, extra_params)
+        )
+        return self._iter_items(fetch, page_size, prefetch)
+
+    def iter_appeals(
+        self,
+        page_size: int = 100,
+        prefetch: int = 1,
+        **filters: Any,
+    ) -> Iterator[Appeal]:
+        """Iterate over all appeals, fetching the next pages in the background.
+
+        Args:
+            page_size: Number of results per page
+            prefetch: Number of page requests kept in flight
+            **filters: Additional filter parameters
+
+        Yields:
+            Each appeal, in order
+        """
+        fetch = functools.partial(self.list_appeals, **filters)
+        return self._iter_items(fetch, page_size, prefetch)
+
+    def _iter_items(
+        self,
+        fetch: Callable[..., PageT],
+        page_size: int,
+        prefetch: int,
+    ) -> Iterator[Any]:
+        with contextlib.closing(self.iter_pages(fetch, page_size, prefetch)) as pages:
+            for page in pages:
+                yield from page.items
 
     # -------------------------------------------------------------------------
     # Generic request methods
@@ -442,7 +966,50 @@ class SyncCinderClient(BaseCinderClient):
             ```
         """
         response = self.client.request(method, path, **kwargs)
-        response.raise_for_status()
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
+        return response
+
+    def build_request(self, method: str, path: str, **kwargs: Any) -> httpx.Request:
+        """Build a request to send later with :meth:`send_prepared`.
+
+        The request carries the client's base URL and headers, so the URL,
+        headers and query parameters are only encoded once even when the
+        request is sent many times.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path (will be appended to base_url)
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            Prepared request
+
+        Example:
+            ```python
+            request = client.build_request("GET", "/api/v1/graph/schema/")
+            for _ in range(10):
+                response = client.send_prepared(request)
+            ```
+        """
+        return self.client.build_request(method, path, **kwargs)
+
+    def send_prepared(self, request: httpx.Request) -> httpx.Response:
+        """Send a request built with :meth:`build_request`.
+
+        Args:
+            request: Prepared request. Its URL can be changed between sends
+                with ``request.url = request.url.copy_with(path=...)``
+
+        Returns:
+            HTTP response
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        response = self.client.send(request)
+        if response.status_code not in self._OK_STATUSES:
+            response.raise_for_status()
         return response
 
 
@@ -456,6 +1023,14 @@ def get_sync_client(
     This is a convenience function that reads configuration from environment
     variables if not provided explicitly.
 
+    Clients are shared per (base_url, token, kwargs) so repeated calls, e.g.
+    from every request of a web app, reuse the same connection pool. Shared
+    clients ignore ``close()`` and ``with`` exits, since other threads may be
+    using them, and are closed at interpreter exit. Calls with unhashable
+    kwargs (e.g. a headers dict) always create a new, unshared client, to be
+    closed by the caller. ``get_sync_client.cache_clear()`` closes and forgets
+    the shared clients.
+
     Args:
         token: API token. If not provided, reads from CINDER_API_TOKEN env var.
         base_url: Base URL for the API. If not provided, reads from CINDER_API_URL env var.
@@ -479,8 +1054,7 @@ def get_sync_client(
             base_url="https://api.example.com"
         )
 
-        with client:
-            decisions = client.list_decisions()
+        decisions = client.list_decisions()
         ```
     """
     if token is None:
@@ -497,8 +1071,29 @@ def get_sync_client(
                 "Base URL must be provided via 'base_url' parameter or CINDER_API_URL environment variable"
             )
 
-    return SyncCinderClient(
-        base_url=base_url,
-        token=token,
-        **kwargs,
-    )
+    try:
+        key = (base_url, token, frozenset(kwargs.items()))
+    except TypeError:
+        # Unhashable arguments cannot be compared, don't share the client
+        return SyncCinderClient(base_url=base_url, token=token, **kwargs)
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = SyncCinderClient(
+                base_url=base_url, token=token, **kwargs
+            )
+            client._shared = True
+    return client
+
+
+def _clear_clients() -> None:
+    """Close and forget the clients shared by get_sync_client()."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client._close()
+
+
+get_sync_client.cache_clear = _clear_clients  # type: ignore[attr-defined]
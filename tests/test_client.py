@@ -1,18 +1,75 @@
 """Tests for the CinderClient."""
+import asyncio
+import json
+import subprocess
+import sys
+import warnings
+from types import SimpleNamespace
+
+import httpx
 import pytest
 import respx
-from httpx import Response
+from httpx import HTTPStatusError, Response
+
+from cinder import AiohttpTransport, CinderClient, ReportBatcher, get_client
+from cinder import client as client_module
+from cinder.generated.models import (
+    Appeal,
+    CreateEntitiesAndRelationshipsResponseSchema,
+    CreateReportSchema,
+    CustomerEvent,
+    DecisionSchema,
+    EntityApiSchema,
+    EntitySchemaResponse,
+    EventEntity,
+    PagedDecisionSchema,
+    PagedReport,
+    RelationshipApiSchema,
+    Report,
+    SchemaResponse,
+    StatusOkResponse,
+    WorkflowResult,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mocked_api():
+    """Mock the API for the whole module, patching httpx only once."""
+    with respx.mock:
+        yield respx.mock
+
+
+@pytest.fixture(autouse=True)
+def api_routes(mocked_api):
+    """Check and drop the routes each test registers on the module's mock."""
+    try:
+        yield mocked_api
+        mocked_api.assert_all_called()
+    finally:
+        mocked_api.clear()
+        mocked_api.reset()
 
-from cinder import CinderClient
-from cinder.generated.models import SchemaResponse
+
+class _SessionTransport(httpx.AsyncHTTPTransport):
+    """Transport shared by the test clients, which closing a client leaves open."""
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def transport():
+    """Connection pool shared by the test clients, built once per session."""
+    return _SessionTransport(http2=True)
 
 
 @pytest.fixture
-def client():
+def client(transport):
     """Create a test client instance."""
     return CinderClient(
         base_url="https://api.example.com",
-        token="test-token"
+        token="test-token",
+        transport=transport,
     )
 
 
@@ -99,7 +156,6 @@ class TestGetGraphSchema:
     """Tests for the get_graph_schema method."""
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_success(self, client, sample_schema_response):
         """Test successful retrieval of graph schema."""
         # Mock the API endpoint
@@ -134,7 +190,6 @@ class TestGetGraphSchema:
         assert len(schema.relationship_schemas[0].entity_pairs_by_slug) == 1
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_empty(self, client, empty_schema_response):
         """Test retrieval of empty graph schema."""
         # Mock the API endpoint with empty schema
@@ -155,7 +210,6 @@ class TestGetGraphSchema:
         assert len(schema.relationship_schemas) == 0
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_unauthorized(self, client):
         """Test handling of 403 Forbidden response."""
         # Mock the API endpoint with 403 error
@@ -172,7 +226,6 @@ class TestGetGraphSchema:
             assert "403" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_server_error(self, client):
         """Test handling of 500 Internal Server Error response."""
         # Mock the API endpoint with 500 error
@@ -188,7 +241,6 @@ class TestGetGraphSchema:
             assert "500" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_network_error(self, client):
         """Test handling of network errors."""
         # Mock the API endpoint to raise a connection error
@@ -204,7 +256,6 @@ class TestGetGraphSchema:
                 await client.get_graph_schema()
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_validates_response(self, client):
         """Test that invalid response data raises validation error."""
         # Mock the API endpoint with invalid data (missing required fields)
@@ -218,7 +269,6 @@ class TestGetGraphSchema:
                 await client.get_graph_schema()
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_with_auth_header(self, client):
         """Test that authorization header is sent correctly."""
         route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
@@ -238,7 +288,6 @@ class TestGetGraphSchema:
         assert request.headers["Authorization"] == "Bearer test-token"
 
     @pytest.mark.asyncio
-    @respx.mock
     async def test_get_graph_schema_attribute_details(self, client, sample_schema_response):
         """Test detailed attribute schema parsing."""
         respx.get("https://api.example.com/api/v1/graph/schema/").mock(
@@ -258,3 +307,965 @@ class TestGetGraphSchema:
         assert username_attr.label == "Username"
         assert username_attr.attribute_type == "string"
         assert username_attr.attribute_sub_type is None
+
+    @pytest.mark.asyncio
+    async def test_get_graph_schema_without_validation(self, sample_schema_response):
+        """Test that trusted responses are built recursively without validation."""
+        respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json=sample_schema_response)
+        )
+
+        client = CinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            validate_responses=False,
+        )
+        async with client:
+            schema = await client.get_graph_schema()
+
+        # Nested models are still built, not left as dicts
+        assert isinstance(schema, SchemaResponse)
+        assert isinstance(schema.entity_schemas[0], EntitySchemaResponse)
+        assert schema.entity_schemas[0].title_attribute.slug == "username"
+        assert schema.relationship_schemas[0].entity_pairs_by_slug[0].target_slug == "post"
+
+
+class TestSchemaCache:
+    """Tests for the graph schema cache."""
+
+    @pytest.mark.asyncio
+    async def test_schema_served_from_cache(self, client, sample_schema_response):
+        """Test that the schema is fetched once within the TTL."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json=sample_schema_response)
+        )
+
+        async with client:
+            first = await client.get_graph_schema()
+            second = await client.get_graph_schema()
+            client.invalidate_schema_cache()
+            third = await client.get_graph_schema()
+
+        assert route.call_count == 2
+        assert second is first
+        assert third is not first
+
+    @pytest.mark.asyncio
+    async def test_schema_revalidated_with_etag(self, transport, sample_schema_response):
+        """Test that an expired schema is revalidated and a 304 reuses it."""
+        client = CinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            transport=transport,
+            schema_cache_ttl=0,
+        )
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[
+                Response(200, json=sample_schema_response, headers={"ETag": '"v1"'}),
+                Response(304),
+            ]
+        )
+
+        async with client:
+            first = await client.get_graph_schema()
+            second = await client.get_graph_schema()
+
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_schema_etag_dropped_when_missing(self, transport, sample_schema_response):
+        """Test that a response without an ETag forgets the previous one."""
+        client = CinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            transport=transport,
+            schema_cache_ttl=0,
+        )
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[
+                Response(200, json=sample_schema_response, headers={"ETag": '"v1"'}),
+                Response(200, json=sample_schema_response),
+                Response(200, json=sample_schema_response),
+            ]
+        )
+
+        async with client:
+            for _ in range(3):
+                await client.get_graph_schema()
+
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in route.calls[2].request.headers
+
+@pytest.fixture
+def report_response():
+    """Build a create_report response echoing the request's reasoning."""
+
+    def respond(request):
+        body = json.loads(request.content)
+        if body["reasoning"] == "fail":
+            return Response(500, json={"error": "Internal Server Error"})
+        return Response(200, json={
+            "reasoning": body["reasoning"],
+            "created_at": "2026-01-01T00:00:00Z",
+            "metadata": None,
+            "entity": {"entity_schema": "user", "attributes": {"id": "123"}},
+            "reporter": None,
+            "attribute_slugs": None,
+        })
+
+    return respond
+
+
+def make_report(reasoning):
+    """Build a report to create."""
+    return CreateReportSchema(
+        queue_slug="default",
+        entity_type="user",
+        entity={"id": "123"},
+        reasoning=reasoning,
+    )
+
+
+class TestCreateReport:
+    """Tests for the create_report method."""
+
+    @pytest.mark.asyncio
+    async def test_create_report_sends_json_body(self, client):
+        """Test that the report is sent as JSON without None values."""
+        route = respx.post("https://api.example.com/api/v1/create_report/").mock(
+            return_value=Response(200, json={
+                "reasoning": "spam",
+                "created_at": "2026-01-01T00:00:00Z",
+                "metadata": None,
+                "entity": {"entity_schema": "user", "attributes": {"id": "123"}},
+                "reporter": None,
+                "attribute_slugs": None,
+            })
+        )
+
+        async with client:
+            report = await client.create_report(
+                CreateReportSchema(
+                    queue_slug="default",
+                    entity_type="user",
+                    entity={"id": "123"},
+                    reasoning="spam",
+                )
+            )
+
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "queue_slug": "default",
+            "entity_type": "user",
+            "entity": {"id": "123"},
+            "reasoning": "spam",
+        }
+        assert isinstance(report, Report)
+        assert report.reasoning == "spam"
+
+    @pytest.mark.asyncio
+    async def test_create_report_accepts_encoded_body(self, client, report_response):
+        """Test that an already encoded body is sent as is."""
+        route = respx.post("https://api.example.com/api/v1/create_report/").mock(
+            side_effect=report_response
+        )
+        body = b'{"queue_slug":"default","entity_type":"user","reasoning":"spam"}'
+
+        async with client:
+            report = await client.create_report(body)
+
+        assert route.calls.last.request.content == body
+        assert report.reasoning == "spam"
+
+
+class TestClientInit:
+    """Tests for CinderClient construction."""
+
+    def test_connect_retries_keep_environment_proxies(self, monkeypatch):
+        """Test that HTTPS_PROXY and NO_PROXY apply despite the retrying transport."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        monkeypatch.setenv("NO_PROXY", "internal.example.com")
+        client = CinderClient(base_url="https://api.example.com", token="test-token")
+
+        http_client = client._get_client()
+        mounts = {pattern.pattern: mount for pattern, mount in http_client._mounts.items()}
+        assert http_client._transport._pool._retries == 2
+        assert mounts["https://"]._pool._proxy_url.host == b"proxy.example.com"
+        assert mounts["all://*internal.example.com"] is None
+
+    def test_explicit_proxy_skips_connect_retries(self, monkeypatch):
+        """Test that an explicit proxy replaces the environment's, without retries."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://env-proxy.example.com:3128")
+        client = CinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            proxy="http://proxy.example.com:3128",
+        )
+
+        http_client = client._get_client()
+        mounts = {pattern.pattern: mount for pattern, mount in http_client._mounts.items()}
+        assert list(mounts) == ["all://"]
+        assert mounts["all://"]._pool._proxy_url.host == b"proxy.example.com"
+        assert mounts["all://"]._pool._retries == 0
+
+
+class TestGetClient:
+    """Tests for the get_client factory."""
+
+    @pytest.fixture(autouse=True)
+    async def clear_clients(self):
+        """Reset the shared client cache around each test."""
+        await get_client.cache_clear()
+        yield
+        await get_client.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_cache_clear_closes_clients(self, empty_schema_response):
+        """Test that clearing the cache closes the loop's shared clients."""
+        respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json=empty_schema_response)
+        )
+        client = get_client(token="test-token", base_url="https://api.example.com")
+        await client.get_graph_schema()
+        http_client = client.client
+
+        await get_client.cache_clear()
+
+        assert http_client.is_closed
+        assert get_client(
+            token="test-token", base_url="https://api.example.com"
+        ) is not client
+
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_client(self):
+        """Test that repeated calls share one client and connection pool."""
+        first = get_client(token="test-token", base_url="https://api.example.com")
+        second = get_client(token="test-token", base_url="https://api.example.com")
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_get_client_separates_tokens(self):
+        """Test that clients are shared per token."""
+        first = get_client(token="token-a", base_url="https://api.example.com")
+        second = get_client(token="token-b", base_url="https://api.example.com")
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_get_client_shares_per_kwargs(self):
+        """Test that clients are shared per constructor arguments."""
+        first = get_client(
+            token="test-token", base_url="https://api.example.com", timeout=5.0
+        )
+        second = get_client(
+            token="test-token", base_url="https://api.example.com", timeout=5.0
+        )
+        default = get_client(token="test-token", base_url="https://api.example.com")
+
+        assert first is second
+        assert first is not default
+        assert first.timeout == 5.0
+
+    @pytest.mark.asyncio
+    async def test_get_client_unhashable_kwargs(self):
+        """Test that unhashable arguments always create a new client."""
+        first = get_client(
+            token="test-token", base_url="https://api.example.com", headers={"X-A": "1"}
+        )
+        second = get_client(
+            token="test-token", base_url="https://api.example.com", headers={"X-A": "1"}
+        )
+
+        assert first is not second
+        assert first.headers["X-A"] == "1"
+
+    def test_uvloop_not_installed_by_default(self, monkeypatch):
+        """Test that the event loop policy is left alone unless opted in."""
+        monkeypatch.delenv("CINDER_USE_UVLOOP", raising=False)
+        monkeypatch.setattr(client_module, "_uvloop_checked", False)
+        policy = asyncio.get_event_loop_policy()
+
+        get_client(token="test-token", base_url="https://api.example.com")
+
+        assert asyncio.get_event_loop_policy() is policy
+        assert client_module._uvloop_checked
+
+    def test_uvloop_opt_in(self, monkeypatch):
+        """Test that CINDER_USE_UVLOOP=1 installs uvloop's policy."""
+        uvloop = pytest.importorskip("uvloop")
+        monkeypatch.setenv("CINDER_USE_UVLOOP", "1")
+        monkeypatch.setattr(client_module, "_uvloop_checked", False)
+        policy = asyncio.get_event_loop_policy()
+        try:
+            get_client(token="test-token", base_url="https://api.example.com")
+            assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+        finally:
+            asyncio.set_event_loop_policy(policy)
+
+    @pytest.mark.asyncio
+    async def test_get_client_ignores_close(self, empty_schema_response):
+        """Test that leaving `async with` keeps a shared client open for others."""
+        respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json=empty_schema_response)
+        )
+        first = get_client(token="test-token", base_url="https://api.example.com")
+        async with first:
+            await first.get_graph_schema()
+
+        assert first.client is not None
+        assert not first.client.is_closed
+
+    def test_get_client_per_event_loop(self):
+        """Test that clients are shared within an event loop, never across loops."""
+
+        async def get_twice():
+            first = get_client(token="test-token", base_url="https://api.example.com")
+            second = get_client(token="test-token", base_url="https://api.example.com")
+            assert first is second
+            return first
+
+        first_loop = asyncio.run(get_twice())
+        second_loop = asyncio.run(get_twice())
+
+        assert first_loop is not second_loop
+
+    def test_get_client_outside_event_loop(self):
+        """Test that calls outside of an event loop return unshared clients."""
+        first = get_client(token="test-token", base_url="https://api.example.com")
+        second = get_client(token="test-token", base_url="https://api.example.com")
+
+        assert first is not second
+        assert not first._shared
+
+
+class TestWarmup:
+    """Tests for the warmup method."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_ignores_errors(self, client):
+        """Test that probes are sent concurrently and failures are ignored."""
+        route = respx.head("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[Response(200), Response(405), Response(200)]
+        )
+
+        async with client:
+            await client.warmup(connections=3)
+
+        assert route.call_count == 3
+
+
+class TestBulkHelpers:
+    """Tests for the bulk upsert and pagination helpers."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_validates_dict_items(self, client):
+        """Test that plain dict items are validated before being sent."""
+        route = respx.post("https://api.example.com/api/v1/graph/").mock(
+            return_value=Response(200, json={"success": True})
+        )
+
+        async with client:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                await client.upsert(
+                    entities=[{"entity_type": "user", "attributes": {"id": "1"}}]
+                )
+
+        assert json.loads(route.calls.last.request.content) == {
+            "entities": [{"entity_type": "user", "attributes": {"id": "1"}}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_chunks_requests(self, client):
+        """Test that entities and relationships are split into chunks."""
+        route = respx.post("https://api.example.com/api/v1/graph/").mock(
+            return_value=Response(200, json={"success": True})
+        )
+        entities = [
+            EntityApiSchema(entity_type="user", attributes={"id": str(i)})
+            for i in range(5)
+        ]
+        relationships = [
+            RelationshipApiSchema(
+                source_type="user",
+                source_id="0",
+                target_type="user",
+                target_id="1",
+                relationship_type="follows",
+            )
+        ]
+
+        async with client:
+            results = await client.bulk_upsert(
+                entities=entities, relationships=relationships, chunk=2
+            )
+
+        assert route.call_count == 4
+        assert len(results) == 4
+        assert all(
+            isinstance(r, CreateEntitiesAndRelationshipsResponseSchema)
+            for r in results
+        )
+        bodies = [json.loads(call.request.content) for call in route.calls]
+        assert sorted(len(b.get("entities", [])) for b in bodies) == [0, 1, 2, 2]
+        # Relationships are only sent once every entity chunk is done
+        assert "relationships" in bodies[-1]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_returns_exceptions(self, client):
+        """Test that failed chunks are reported instead of raised."""
+        respx.post("https://api.example.com/api/v1/graph/").mock(
+            return_value=Response(500, json={"error": "Internal Server Error"})
+        )
+        entities = [EntityApiSchema(entity_type="user", attributes={"id": "1"})]
+
+        async with client:
+            results = await client.bulk_upsert(entities=entities)
+
+        assert len(results) == 1
+        assert isinstance(results[0], HTTPStatusError)
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_yields_pages_in_order(self, client):
+        """Test that pages are fetched ahead and yielded in order."""
+        offsets = []
+
+        async def fetch(limit, offset):
+            offsets.append(offset)
+            count = min(limit, 5 - offset) if offset < 5 else 0
+            return PagedReport.model_construct(items=[offset] * count, count=5)
+
+        pages = [
+            page async for page in client.iter_pages(fetch, page_size=2, prefetch=2)
+        ]
+
+        assert [page.items for page in pages] == [[0, 0], [2, 2], [4]]
+        assert offsets[:3] == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_iter_decisions_yields_items(self, client, sample_decision):
+        """Test that decisions from every page are yielded in order."""
+
+        def respond(request):
+            offset = int(request.url.params["offset"])
+            items = [
+                {**sample_decision, "uuid": f"decision-{i}"}
+                for i in range(offset, min(offset + 2, 3))
+            ]
+            return Response(200, json={"items": items, "count": 3})
+
+        route = respx.get("https://api.example.com/api/v1/decisions/").mock(
+            side_effect=respond
+        )
+
+        async with client:
+            uuids = [
+                decision.uuid
+                async for decision in client.iter_decisions(page_size=2, prefetch=1)
+            ]
+
+        assert uuids == ["decision-0", "decision-1", "decision-2"]
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_large_pages_parsed_in_thread(self, client, sample_decision, monkeypatch):
+        """Test that pages over the size threshold are parsed off the event loop."""
+        respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(200, json={"items": [sample_decision], "count": 1})
+        )
+        offloaded = []
+        to_thread = asyncio.to_thread
+
+        async def spy(func, *args):
+            offloaded.append(args[0])
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", spy)
+
+        async with client:
+            await client.list_decisions()
+            client._OFFLOAD_THRESHOLD = 0
+            page = await client.list_decisions()
+
+        assert offloaded == [PagedDecisionSchema]
+        assert page.items[0].uuid == "decision-1"
+
+    @pytest.mark.asyncio
+    async def test_create_reports_returns_results_in_order(self, client, report_response):
+        """Test that reports are created concurrently, errors returned in place."""
+        route = respx.post("https://api.example.com/api/v1/create_report/").mock(
+            side_effect=report_response
+        )
+
+        async with client:
+            results = await client.create_reports(
+                [make_report("a"), make_report("fail"), make_report("c")],
+                max_concurrency=2,
+            )
+
+        assert route.call_count == 3
+        assert [r.reasoning for r in (results[0], results[2])] == ["a", "c"]
+        assert isinstance(results[1], HTTPStatusError)
+
+
+class TestReportBatcher:
+    """Tests for the ReportBatcher buffer."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self, client, report_response):
+        """Test that a full batch is sent without waiting."""
+        route = respx.post("https://api.example.com/api/v1/create_report/").mock(
+            side_effect=report_response
+        )
+
+        async with client:
+            batcher = ReportBatcher(client, max_batch=2, max_wait=60)
+            first = await batcher.add(make_report("a"))
+            second = await batcher.add(make_report("b"))
+            reports = await asyncio.gather(first, second)
+
+        assert route.call_count == 2
+        assert [r.reasoning for r in reports] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_max_wait(self, client, report_response):
+        """Test that queued reports are sent once the oldest has waited max_wait."""
+        respx.post("https://api.example.com/api/v1/create_report/").mock(
+            side_effect=report_response
+        )
+
+        async with client:
+            batcher = ReportBatcher(client, max_batch=100, max_wait=0.01)
+            future = await batcher.add(make_report("a"))
+            report = await asyncio.wait_for(future, timeout=1)
+
+        assert report.reasoning == "a"
+
+    @pytest.mark.asyncio
+    async def test_exit_flushes_and_reports_errors(self, client, report_response):
+        """Test that leaving the context sends queued reports."""
+        respx.post("https://api.example.com/api/v1/create_report/").mock(
+            side_effect=report_response
+        )
+
+        async with client, ReportBatcher(client, max_wait=60) as batcher:
+            ok = await batcher.add(make_report("a"))
+            failed = await batcher.add(make_report("fail"))
+
+        assert ok.result().reasoning == "a"
+        assert isinstance(failed.exception(), HTTPStatusError)
+
+
+    @pytest.mark.asyncio
+    async def test_short_results_fail_the_batch(self, client, monkeypatch):
+        """Test that missing results fail every report instead of hanging."""
+
+        async def create_reports(reports, max_concurrency):
+            return [make_report("a")]
+
+        monkeypatch.setattr(client, "create_reports", create_reports)
+
+        async with ReportBatcher(client, max_wait=60) as batcher:
+            first = await batcher.add(make_report("a"))
+            second = await batcher.add(make_report("b"))
+
+        for future in (first, second):
+            assert isinstance(future.exception(), ValueError)
+
+class TestSendEventSync:
+    """Tests for the send_event_sync method."""
+
+    @pytest.fixture
+    def event(self):
+        """Sample customer event."""
+        return CustomerEvent(
+            event_name="user.signup",
+            entity=EventEntity(entity_schema="User", attributes={"id": "123"}),
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_event_sync_workflow_result(self, client, event):
+        """Test that a 200 response is parsed as a WorkflowResult."""
+        respx.post("https://api.example.com/api/v2/workflows/event/sync/").mock(
+            return_value=Response(200, json={"path": ["start"], "actions": []})
+        )
+
+        async with client:
+            result = await client.send_event_sync(event)
+
+        assert isinstance(result, WorkflowResult)
+        assert result.path == ["start"]
+
+    @pytest.mark.asyncio
+    async def test_send_event_sync_no_workflow(self, client, event):
+        """Test that a 202 response is parsed as a StatusOkResponse."""
+        respx.post("https://api.example.com/api/v2/workflows/event/sync/").mock(
+            return_value=Response(202, json={"status": "ok"})
+        )
+
+        async with client:
+            result = await client.send_event_sync(event)
+
+        assert isinstance(result, StatusOkResponse)
+
+
+@pytest.fixture
+def sample_decision():
+    """Sample decision data."""
+    return {
+        "uuid": "decision-1",
+        "entity": {"entity_type": "user", "attributes": {"id": "123"}},
+        "notes": "",
+        "is_training": False,
+        "created_at": "2026-01-01T00:00:00Z",
+        "decision_type": "manual",
+    }
+
+
+class TestStreamDecisions:
+    """Tests for the stream_decisions method."""
+
+    @pytest.mark.asyncio
+    async def test_stream_decisions(self, client, sample_decision):
+        """Test that decisions are parsed incrementally from the response."""
+        pytest.importorskip("ijson")
+        route = respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(200, json={
+                "items": [sample_decision, {**sample_decision, "uuid": "decision-2"}],
+                "count": 2,
+            })
+        )
+
+        async with client:
+            decisions = [d async for d in client.stream_decisions(limit=2)]
+
+        assert route.calls.last.request.url.params["limit"] == "2"
+        assert [d.uuid for d in decisions] == ["decision-1", "decision-2"]
+        assert all(isinstance(d, DecisionSchema) for d in decisions)
+        assert decisions[0].created_at.year == 2026
+
+    @pytest.mark.asyncio
+    async def test_stream_decisions_error(self, client):
+        """Test that HTTP errors are raised before any decision is yielded."""
+        pytest.importorskip("ijson")
+        respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(403, json={"error": "Forbidden"})
+        )
+
+        async with client:
+            with pytest.raises(HTTPStatusError):
+                async for _ in client.stream_decisions():
+                    pass
+
+
+class TestRetries:
+    """Tests for retries of idempotent requests."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record the delays slept for instead of sleeping."""
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(client_module.asyncio, "sleep", sleep)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_status(self, client, sample_schema_response, sleeps):
+        """Test that a 503 is retried, honoring Retry-After."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[
+                Response(503, headers={"Retry-After": "2"}),
+                Response(502),
+                Response(200, json=sample_schema_response),
+            ]
+        )
+
+        async with client:
+            schema = await client.get_graph_schema()
+
+        assert isinstance(schema, SchemaResponse)
+        assert route.call_count == 3
+        assert sleeps[0] == 2.0
+        assert 0 < sleeps[1] <= client._RETRY_BACKOFF_CAP
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, transport, sleeps):
+        """Test that the last response is raised once retries are exhausted."""
+        client = CinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            transport=transport,
+            max_retries=1,
+        )
+        route = respx.get("https://api.example.com/api/v1/appeal/1/").mock(
+            return_value=Response(429)
+        )
+
+        async with client:
+            with pytest.raises(HTTPStatusError):
+                await client.get_appeal("1")
+
+        assert route.call_count == 2
+        assert len(sleeps) == 1
+
+    @pytest.mark.asyncio
+    async def test_server_error_not_retried(self, client, sleeps):
+        """Test that other errors are raised immediately."""
+        route = respx.get("https://api.example.com/api/v1/appeal/1/").mock(
+            return_value=Response(500)
+        )
+
+        async with client:
+            with pytest.raises(HTTPStatusError):
+                await client.get_appeal("1")
+
+        assert route.call_count == 1
+        assert sleeps == []
+
+
+class TestFastLists:
+    """Tests for decoding list pages with msgspec."""
+
+    @pytest.fixture
+    def fast_client(self, transport):
+        """Client decoding list pages with msgspec."""
+        pytest.importorskip("msgspec")
+        return CinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            transport=transport,
+            fast_lists=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_decisions_fast(self, fast_client, sample_decision):
+        """Test that decision pages decode into structs convertible to models."""
+        respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(200, json={"items": [sample_decision], "count": 1})
+        )
+
+        async with fast_client:
+            page = await fast_client.list_decisions()
+
+        assert page.count == 1
+        decision = page.items[0]
+        assert decision.uuid == "decision-1"
+        assert decision.created_at.year == 2026
+        assert isinstance(decision.to_model(), DecisionSchema)
+
+    @pytest.mark.asyncio
+    async def test_list_reports_fast(self, fast_client):
+        """Test that report pages decode into structs convertible to models."""
+        respx.get("https://api.example.com/api/v1/report/").mock(
+            return_value=Response(200, json={
+                "items": [{
+                    "reasoning": "spam",
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "metadata": None,
+                    "entity": {"entity_schema": "user", "attributes": {"id": "1"}},
+                    "reporter": None,
+                    "attribute_slugs": None,
+                }],
+                "count": 1,
+            })
+        )
+
+        async with fast_client:
+            page = await fast_client.list_reports()
+
+        assert page.count == 1
+        assert page.items[0].reasoning == "spam"
+        assert isinstance(page.items[0].to_model(), Report)
+
+    @pytest.mark.asyncio
+    async def test_list_appeals_fast(self, fast_client):
+        """Test that appeal pages decode into structs convertible to models."""
+        respx.get("https://api.example.com/api/v1/appeal/").mock(
+            return_value=Response(200, json={
+                "items": [{
+                    "appealer": None,
+                    "appealer_reasoning": "not spam",
+                    "appealed_decision": None,
+                    "resolved_by_decision": None,
+                    "source": "subject",
+                    "outcome": None,
+                    "created_at": "2026-01-01T00:00:00Z",
+                }],
+                "count": 1,
+            })
+        )
+
+        async with fast_client:
+            page = await fast_client.list_appeals()
+
+        assert page.count == 1
+        assert page.items[0].appealer_reasoning == "not spam"
+        assert isinstance(page.items[0].to_model(), Appeal)
+
+
+class TestAiohttpTransport:
+    """Tests for running the client on the aiohttp transport."""
+
+    @pytest.mark.asyncio
+    async def test_get_graph_schema_over_aiohttp(self, sample_schema_response):
+        """Test a full request/response cycle against a local aiohttp server."""
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        seen_headers = {}
+
+        async def schema_view(request):
+            seen_headers.update(request.headers)
+            return web.json_response(sample_schema_response)
+
+        app = web.Application()
+        app.router.add_get("/api/v1/graph/schema/", schema_view)
+
+        async with TestServer(app) as server, CinderClient(
+            base_url=str(server.make_url("/")),
+            token="test-token",
+            transport=AiohttpTransport(),
+        ) as client:
+            schema = await client.get_graph_schema()
+
+        assert seen_headers["Authorization"] == "Bearer test-token"
+        assert isinstance(schema, SchemaResponse)
+        assert len(schema.entity_schemas) == 2
+
+    @pytest.fixture
+    async def slow_server(self):
+        """Local aiohttp server taking a second to answer."""
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def slow_view(request):
+            await asyncio.sleep(1)
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/slow/", slow_view)
+        async with TestServer(app) as server:
+            yield server
+
+    @pytest.mark.asyncio
+    async def test_read_timeout(self, slow_server):
+        """Test that a server slow to answer raises httpx.ReadTimeout."""
+        client = CinderClient(
+            base_url=str(slow_server.make_url("/")),
+            token="test-token",
+            timeout=0.05,
+            transport=AiohttpTransport(),
+        )
+
+        async with client:
+            with pytest.raises(httpx.ReadTimeout):
+                await client._get("/slow/")
+
+    @pytest.mark.asyncio
+    async def test_connect_timeout(self, slow_server):
+        """Test that waiting too long for a connection raises httpx.ConnectTimeout."""
+        transport = AiohttpTransport(limit=1)
+        url = str(slow_server.make_url("/slow/"))
+
+        def request(connect):
+            return httpx.Request(
+                "GET", url, extensions={"timeout": {"connect": connect, "read": 5}}
+            )
+
+        try:
+            # The only connection is busy with the first request
+            busy = asyncio.ensure_future(transport.handle_async_request(request(5)))
+            await asyncio.sleep(0.1)
+            with pytest.raises(httpx.ConnectTimeout):
+                await transport.handle_async_request(request(0.05))
+            await busy
+        finally:
+            await transport.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "make_error, expected",
+        [
+            (lambda aiohttp: aiohttp.ConnectionTimeoutError(), httpx.ConnectTimeout),
+            (lambda aiohttp: aiohttp.SocketTimeoutError(), httpx.ReadTimeout),
+            (
+                lambda aiohttp: aiohttp.ClientConnectorError(
+                    SimpleNamespace(host="api.example.com", port=443, ssl=True),
+                    OSError(111, "Connection refused"),
+                ),
+                httpx.ConnectError,
+            ),
+            (lambda aiohttp: aiohttp.ServerDisconnectedError(), httpx.RemoteProtocolError),
+            (lambda aiohttp: aiohttp.ClientPayloadError("truncated"), httpx.ReadError),
+            (lambda aiohttp: aiohttp.InvalidURL("http://[::1"), httpx.InvalidURL),
+        ],
+    )
+    async def test_errors_map_to_httpx(self, make_error, expected):
+        """Test that aiohttp errors surface as the matching httpx exceptions."""
+        aiohttp = pytest.importorskip("aiohttp")
+        error = make_error(aiohttp)
+
+        class FailingSession:
+            def request(self, *args, **kwargs):
+                raise error
+
+        transport = AiohttpTransport()
+        transport._get_session = FailingSession
+
+        with pytest.raises(expected) as exc_info:
+            await transport.handle_async_request(
+                httpx.Request("GET", "https://api.example.com/api/v1/graph/schema/")
+            )
+        assert exc_info.value.__cause__ is error
+
+    def test_cinder_transport_env_var(self, monkeypatch):
+        """Test that CINDER_TRANSPORT=aiohttp selects the aiohttp transport."""
+        pytest.importorskip("aiohttp")
+        monkeypatch.setenv("CINDER_TRANSPORT", "aiohttp")
+
+        client = CinderClient(base_url="https://api.example.com", token="test-token")
+
+        assert isinstance(client._get_client()._transport, AiohttpTransport)
+
+
+class TestPackageImports:
+    """Tests for the lazy package-level imports."""
+
+    def test_import_does_not_load_models(self):
+        """Test that importing the package defers loading clients and models."""
+        code = (
+            "import sys, cinder; "
+            "assert 'cinder.generated.models' not in sys.modules; "
+            "assert 'cinder.client' not in sys.modules; "
+            "cinder.Report; "
+            "assert 'cinder.generated.models' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_client_import_skips_optional_dependencies(self):
+        """Test that optional dependencies are only imported when used."""
+        code = (
+            "import sys, cinder.client, cinder.sync_client; "
+            "assert 'aiohttp' not in sys.modules; "
+            "assert 'ijson' not in sys.modules; "
+            "assert 'msgspec' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazy_attributes(self):
+        """Test that every exported name resolves."""
+        import cinder
+
+        for name in cinder.__all__:
+            assert getattr(cinder, name) is not None
+        with pytest.raises(AttributeError):
+            getattr(cinder, "DoesNotExist")
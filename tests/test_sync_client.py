@@ -1,15 +1,55 @@
 """Tests for the SyncCinderClient."""
+import importlib.util
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from cinder import SyncCinderClient
-from cinder.generated.models import SchemaResponse
+from cinder import SyncCinderClient, build_transport, get_sync_client
+from cinder import sync_client as sync_client_module
+from cinder.base_client import _warmed
+from cinder.generated.models import (
+    CreateEntitiesAndRelationshipsResponseSchema,
+    CreateReportSchema,
+    DecisionFilter,
+    DecisionSchema,
+    EntityApiSchema,
+    EntitySchemaResponse,
+    PagedReport,
+    RelationshipApiSchema,
+    SchemaResponse,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mocked_api():
+    """Mock the API for the whole module, patching httpx only once."""
+    with respx.mock:
+        yield respx.mock
+
+
+@pytest.fixture(autouse=True)
+def api_routes(mocked_api):
+    """Check and drop the routes each test registers on the module's mock."""
+    try:
+        yield mocked_api
+        mocked_api.assert_all_called()
+    finally:
+        mocked_api.clear()
+        mocked_api.reset()
 
 
 @pytest.fixture
 def client():
-    """Create a test sync client instance."""
+    """Create a test sync client instance.
+
+    Clients with the default options share one connection pool, which
+    closing a client leaves open, so this stays cheap across tests.
+    """
     return SyncCinderClient(
         base_url="https://api.example.com",
         token="test-token"
@@ -47,7 +87,6 @@ def sample_schema_response():
 class TestSyncGetGraphSchema:
     """Tests for the synchronous get_graph_schema method."""
 
-    @respx.mock
     def test_get_graph_schema_success(self, client, sample_schema_response):
         """Test successful retrieval of graph schema."""
         # Mock the API endpoint
@@ -68,7 +107,6 @@ class TestSyncGetGraphSchema:
         assert len(schema.entity_schemas) == 1
         assert schema.entity_schemas[0].slug == "user"
 
-    @respx.mock
     def test_get_graph_schema_with_auth_header(self, client):
         """Test that authorization header is sent correctly."""
         route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
@@ -86,8 +124,8 @@ class TestSyncGetGraphSchema:
         request = route.calls.last.request
         assert "Authorization" in request.headers
         assert request.headers["Authorization"] == "Bearer test-token"
+        assert request.headers["Accept"] == "application/json"
 
-    @respx.mock
     def test_get_graph_schema_error_handling(self, client):
         """Test handling of API errors."""
         respx.get("https://api.example.com/api/v1/graph/schema/").mock(
@@ -100,7 +138,6 @@ class TestSyncGetGraphSchema:
 
             assert "403" in str(exc_info.value)
 
-    @respx.mock
     def test_context_manager(self, client, sample_schema_response):
         """Test that context manager properly opens and closes the client."""
         respx.get("https://api.example.com/api/v1/graph/schema/").mock(
@@ -120,3 +157,751 @@ class TestSyncGetGraphSchema:
         """Test manual close method."""
         # Should not raise an error
         client.close()
+
+    def test_get_graph_schema_without_validation(self):
+        """Test that invalid data is not rejected when validation is disabled."""
+        respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json={"entity_schemas": []})
+        )
+
+        client = SyncCinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            validate_responses=False,
+        )
+        with client:
+            schema = client.get_graph_schema()
+
+        assert isinstance(schema, SchemaResponse)
+        assert schema.entity_schemas == []
+
+    def test_custom_headers(self):
+        """Test that custom headers are sent without mutating the caller's dict."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json={
+                "entity_schemas": [],
+                "relationship_schemas": []
+            })
+        )
+        headers = {"X-Request-Source": "tests"}
+
+        with SyncCinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            headers=headers,
+        ) as client:
+            client.get_graph_schema()
+
+        request = route.calls.last.request
+        assert request.headers["X-Request-Source"] == "tests"
+        assert request.headers["Authorization"] == "Bearer test-token"
+        assert headers == {"X-Request-Source": "tests"}
+
+
+class TestSyncSchemaCache:
+    """Tests for the graph schema cache."""
+
+    def test_schema_served_from_cache(self, client, sample_schema_response):
+        """Test that the schema is fetched once within the TTL."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json=sample_schema_response)
+        )
+
+        first = client.get_graph_schema()
+        second = client.get_graph_schema()
+        client.invalidate_schema_cache()
+        third = client.get_graph_schema()
+
+        assert route.call_count == 2
+        assert second is first
+        assert third is not first
+
+    def test_schema_revalidated_with_etag(self, sample_schema_response):
+        """Test that an expired schema is revalidated and a 304 reuses it."""
+        client = SyncCinderClient(
+            base_url="https://api.example.com", token="test-token", schema_cache_ttl=0
+        )
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[
+                Response(200, json=sample_schema_response, headers={"ETag": '"v1"'}),
+                Response(304),
+            ]
+        )
+
+        first = client.get_graph_schema()
+        second = client.get_graph_schema()
+
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert second is first
+
+
+    def test_schema_etag_dropped_when_missing(self, sample_schema_response):
+        """Test that a response without an ETag forgets the previous one."""
+        client = SyncCinderClient(
+            base_url="https://api.example.com", token="test-token", schema_cache_ttl=0
+        )
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[
+                Response(200, json=sample_schema_response, headers={"ETag": '"v1"'}),
+                Response(200, json=sample_schema_response),
+                Response(200, json=sample_schema_response),
+            ]
+        )
+
+        client.get_graph_schema()
+        client.get_graph_schema()
+        client.get_graph_schema()
+
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert "If-None-Match" not in route.calls[2].request.headers
+
+class TestSyncRetries:
+    """Tests for retries of idempotent requests."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record the delays slept for instead of sleeping."""
+        delays = []
+        monkeypatch.setattr(sync_client_module.time, "sleep", delays.append)
+        return delays
+
+    def test_retries_transient_status(self, client, sample_schema_response, sleeps):
+        """Test that a 503 is retried, honoring Retry-After."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            side_effect=[
+                Response(503, headers={"Retry-After": "2"}),
+                Response(502),
+                Response(200, json=sample_schema_response),
+            ]
+        )
+
+        schema = client.get_graph_schema()
+
+        assert isinstance(schema, SchemaResponse)
+        assert route.call_count == 3
+        assert sleeps[0] == 2.0
+        assert 0 < sleeps[1] <= client._RETRY_BACKOFF_CAP
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        """Test that the last response is raised once retries are exhausted."""
+        client = SyncCinderClient(
+            base_url="https://api.example.com", token="test-token", max_retries=1
+        )
+        route = respx.get("https://api.example.com/api/v1/appeal/1/").mock(
+            return_value=Response(429)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_appeal("1")
+
+        assert route.call_count == 2
+        assert len(sleeps) == 1
+
+    def test_server_error_not_retried(self, client, sleeps):
+        """Test that other errors are raised immediately."""
+        route = respx.get("https://api.example.com/api/v1/appeal/1/").mock(
+            return_value=Response(500)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_appeal("1")
+
+        assert route.call_count == 1
+        assert sleeps == []
+
+    def test_connect_retries_transport(self, client):
+        """Test that connection attempts are retried by the transport."""
+        transport = client.client._transport
+
+        assert isinstance(transport, httpx.HTTPTransport)
+        assert transport._pool._retries == 2
+        assert transport._pool._max_connections == 64
+
+    def test_connect_retries_keep_environment_proxies(self, monkeypatch):
+        """Test that HTTPS_PROXY and NO_PROXY apply despite the retrying transport."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        monkeypatch.setenv("NO_PROXY", "internal.example.com")
+        client = SyncCinderClient(base_url="https://api.example.com", token="test-token")
+
+        mounts = {pattern.pattern: mount for pattern, mount in client.client._mounts.items()}
+        proxy = mounts["https://"]
+        assert isinstance(proxy, httpx.HTTPTransport)
+        assert proxy._pool._proxy_url.host == b"proxy.example.com"
+        assert proxy._pool._max_connections == 64
+        assert mounts["all://*internal.example.com"] is None
+
+        untrusting = SyncCinderClient(
+            base_url="https://api.example.com", token="test-token", trust_env=False
+        )
+        assert not untrusting.client._mounts
+
+    def test_explicit_proxy_skips_connect_retries(self, monkeypatch):
+        """Test that an explicit proxy replaces the environment's, without retries."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://env-proxy.example.com:3128")
+        client = SyncCinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            proxy="http://proxy.example.com:3128",
+        )
+
+        mounts = {pattern.pattern: mount for pattern, mount in client.client._mounts.items()}
+        assert list(mounts) == ["all://"]
+        assert mounts["all://"]._pool._proxy_url.host == b"proxy.example.com"
+        assert mounts["all://"]._pool._retries == 0
+
+
+class TestSyncPreparedRequests:
+    """Tests for build_request and send_prepared."""
+
+    def test_send_prepared_reuses_request(self, client):
+        """Test that a prepared request can be sent again with another path."""
+        first = respx.get("https://api.example.com/api/v1/custom/1/").mock(
+            return_value=Response(200, json={"id": 1})
+        )
+        second = respx.get("https://api.example.com/api/v1/custom/2/").mock(
+            return_value=Response(200, json={"id": 2})
+        )
+
+        request = client.build_request("GET", "/api/v1/custom/1/")
+        assert client.send_prepared(request).json() == {"id": 1}
+        request.url = request.url.copy_with(path="/api/v1/custom/2/")
+        assert client.send_prepared(request).json() == {"id": 2}
+
+        assert first.calls.last.request.headers["Authorization"] == "Bearer test-token"
+        assert second.call_count == 1
+
+    def test_send_prepared_raises_for_errors(self, client):
+        """Test that error responses raise like other methods."""
+        respx.get("https://api.example.com/api/v1/custom/").mock(
+            return_value=Response(404)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.send_prepared(client.build_request("GET", "/api/v1/custom/"))
+
+
+class TestSyncWarmup:
+    """Tests for the warmup method."""
+
+    def test_warmup_sends_probes(self, client):
+        """Test that one probe is sent per requested connection."""
+        route = respx.head("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200)
+        )
+
+        client.warmup(connections=2)
+
+        assert route.call_count == 2
+
+
+class TestSyncCompression:
+    """Tests for response compression negotiation."""
+
+    def test_accept_encoding_header(self, client, sample_schema_response):
+        """Test that httpx requests every coding it can decode."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json=sample_schema_response)
+        )
+
+        client.get_graph_schema()
+
+        codings = route.calls[0].request.headers["Accept-Encoding"].split(", ")
+        assert "gzip" in codings
+        for coding, package in (("br", "brotli"), ("zstd", "zstandard")):
+            assert (coding in codings) == (importlib.util.find_spec(package) is not None)
+
+
+class TestSyncListReports:
+    """Tests for the synchronous list_reports method."""
+
+    def test_list_reports_query_params(self, client):
+        """Test that unset parameters are left out of the query string."""
+        route = respx.get("https://api.example.com/api/v1/report/").mock(
+            return_value=Response(200, json={"items": [], "count": 0})
+        )
+
+        with client:
+            page = client.list_reports(limit=10, queue="default", entity_id=None)
+
+        request = route.calls.last.request
+        assert dict(request.url.params) == {"limit": "10", "queue": "default"}
+        assert isinstance(page, PagedReport)
+        assert page.count == 0
+
+    def test_list_reports_query_encoding(self, client):
+        """Test that the query is sorted and encoded as httpx would."""
+        route = respx.get("https://api.example.com/api/v1/report/").mock(
+            return_value=Response(200, json={"items": [], "count": 0})
+        )
+
+        with client:
+            client.list_reports(
+                offset=20, resolved=False, slug=["a b", "c"], is_training=True
+            )
+
+        assert route.calls.last.request.url.query == (
+            b"is_training=true&offset=20&resolved=false&slug=a+b&slug=c"
+        )
+
+
+class TestSyncListDecisions:
+    """Tests for the synchronous list_decisions method."""
+
+    def test_list_decisions_filter_params(self, client):
+        """Test that structured filters are encoded as their JSON values."""
+        route = respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(200, json={"items": [], "count": 0})
+        )
+
+        client.list_decisions(
+            filters=DecisionFilter(
+                created_at__gt="2026-01-01T00:00:00Z",
+                job_category="appeal",
+            )
+        )
+
+        assert dict(route.calls.last.request.url.params) == {
+            "created_at__gt": "2026-01-01T00:00:00Z",
+            "job_category": "appeal",
+        }
+
+
+class TestSyncStreamDecisions:
+    """Tests for the synchronous stream_decisions method."""
+
+    def test_stream_decisions(self, client):
+        """Test that decisions are parsed incrementally from the response."""
+        pytest.importorskip("ijson")
+        decision = {
+            "uuid": "decision-1",
+            "entity": {"entity_type": "user", "attributes": {"id": "123"}},
+            "notes": "",
+            "is_training": False,
+            "created_at": "2026-01-01T00:00:00Z",
+            "decision_type": "manual",
+        }
+        route = respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(200, json={
+                "items": [decision, {**decision, "uuid": "decision-2"}],
+                "count": 2,
+            })
+        )
+
+        with client:
+            decisions = list(client.stream_decisions(limit=2))
+
+        assert route.calls.last.request.url.params["limit"] == "2"
+        assert [d.uuid for d in decisions] == ["decision-1", "decision-2"]
+        assert all(isinstance(d, DecisionSchema) for d in decisions)
+
+    def test_stream_decisions_error(self, client):
+        """Test that HTTP errors are raised before any decision is yielded."""
+        pytest.importorskip("ijson")
+        respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(403, json={"error": "Forbidden"})
+        )
+
+        with client, pytest.raises(httpx.HTTPStatusError):
+            list(client.stream_decisions())
+
+
+class TestSyncIterPages:
+    """Tests for the paginated iterators."""
+
+    def test_iter_reports_yields_items(self, client):
+        """Test that reports from every page are yielded in order."""
+
+        def respond(request):
+            offset = int(request.url.params["offset"])
+            items = [
+                {
+                    "reasoning": f"report-{i}",
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "metadata": None,
+                    "entity": {"entity_schema": "user", "attributes": {"id": "1"}},
+                    "reporter": None,
+                    "attribute_slugs": None,
+                }
+                for i in range(offset, min(offset + 2, 5))
+            ]
+            return Response(200, json={"items": items, "count": 5})
+
+        route = respx.get("https://api.example.com/api/v1/report/").mock(
+            side_effect=respond
+        )
+
+        reasons = [
+            report.reasoning
+            for report in client.iter_reports(page_size=2, prefetch=2, status="open")
+        ]
+
+        assert reasons == [f"report-{i}" for i in range(5)]
+        assert route.call_count == 3
+        assert all(call.request.url.params["status"] == "open" for call in route.calls)
+
+    def test_iter_decisions_sends_filters_on_every_page(self, client):
+        """Test that structured filters are applied to every page."""
+        decision = {
+            "uuid": "decision-1",
+            "entity": {"entity_type": "user", "attributes": {"id": "123"}},
+            "notes": "",
+            "is_training": False,
+            "created_at": "2026-01-01T00:00:00Z",
+            "decision_type": "manual",
+        }
+        route = respx.get("https://api.example.com/api/v1/decisions/").mock(
+            side_effect=[
+                Response(200, json={"items": [decision], "count": 2}),
+                Response(200, json={"items": [decision], "count": 2}),
+            ]
+        )
+
+        decisions = list(
+            client.iter_decisions(page_size=1, filters=DecisionFilter(queue="default"))
+        )
+
+        assert len(decisions) == 2
+        assert [dict(call.request.url.params) for call in route.calls] == [
+            {"limit": "1", "offset": "0", "queue": "default"},
+            {"limit": "1", "offset": "1", "queue": "default"},
+        ]
+
+
+class TestSyncGetAppeal:
+    """Tests for the synchronous get_appeal method."""
+
+    def test_get_appeal_path(self):
+        """Test that the appeal ID is placed in the request path."""
+        route = respx.get("https://api.example.com/api/v1/appeal/appeal-123/").mock(
+            return_value=Response(200, json={"appealer_reasoning": "Not spam"})
+        )
+
+        with SyncCinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            validate_responses=False,
+        ) as client:
+            appeal = client.get_appeal("appeal-123")
+
+        assert route.called
+        assert appeal.appealer_reasoning == "Not spam"
+
+
+class TestSyncCreateReports:
+    """Tests for the synchronous create_reports method."""
+
+    @staticmethod
+    def respond(request):
+        body = json.loads(request.content)
+        if body["reasoning"] == "fail":
+            return Response(500, json={"error": "Internal Server Error"})
+        return Response(200, json={
+            "reasoning": body["reasoning"],
+            "created_at": "2026-01-01T00:00:00Z",
+            "metadata": None,
+            "entity": {"entity_schema": "user", "attributes": {"id": "123"}},
+            "reporter": None,
+            "attribute_slugs": None,
+        })
+
+    def test_create_reports_returns_results_in_order(self, client):
+        """Test that reports are created concurrently, errors returned in place."""
+        route = respx.post("https://api.example.com/api/v1/create_report/").mock(
+            side_effect=self.respond
+        )
+        reports = [
+            CreateReportSchema(
+                queue_slug="default",
+                entity_type="user",
+                entity={"id": "123"},
+                reasoning=reasoning,
+            )
+            for reasoning in ("a", "fail", "c")
+        ]
+
+        with client:
+            results = client.create_reports(reports, max_concurrency=2)
+
+        assert route.call_count == 3
+        assert [r.reasoning for r in (results[0], results[2])] == ["a", "c"]
+        assert isinstance(results[1], httpx.HTTPStatusError)
+
+
+class TestSyncMapGetDecisions:
+    """Tests for the synchronous map_get_decisions method."""
+
+    @staticmethod
+    def respond(request):
+        decision_id = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        if decision_id == "missing":
+            return Response(404, json={"detail": "Not found"})
+        return Response(200, json={
+            "uuid": decision_id,
+            "entity": {"entity_type": "user", "attributes": {"id": "123"}},
+            "notes": "",
+            "is_training": False,
+            "created_at": "2026-01-01T00:00:00Z",
+            "decision_type": "manual",
+        })
+
+    def test_map_get_decisions_keeps_order(self, client):
+        """Test that decisions are fetched concurrently and returned in order."""
+        respx.get(url__regex=r".*/api/v1/decisions/[\w-]+/$").mock(side_effect=self.respond)
+        ids = [f"decision-{i}" for i in range(20)]
+
+        with client:
+            decisions = client.map_get_decisions(ids, max_workers=4)
+
+        assert [decision.uuid for decision in decisions] == ids
+
+    def test_map_get_decisions_from_concurrent_threads(self, client):
+        """Test that calls with different sizes from several threads don't interfere."""
+        respx.get(url__regex=r".*/api/v1/decisions/[\w-]+/$").mock(side_effect=self.respond)
+        ids = [f"decision-{i}" for i in range(20)]
+
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            results = list(
+                callers.map(
+                    lambda size: client.map_get_decisions(ids, max_workers=size),
+                    [1, 2, 3, 4, 2, 1],
+                )
+            )
+
+        assert all([d.uuid for d in decisions] == ids for decisions in results)
+
+    def test_map_get_decisions_raises_first_error(self, client):
+        """Test that a failed request is raised."""
+        respx.get(url__regex=r".*/api/v1/decisions/[\w-]+/$").mock(side_effect=self.respond)
+
+        with client, pytest.raises(httpx.HTTPStatusError):
+            client.map_get_decisions(["decision-1", "missing", "decision-2"])
+
+
+class TestSyncUpsert:
+    """Tests for the synchronous upsert method."""
+
+    def test_upsert_body(self, client):
+        """Test that only provided lists are sent, without None values."""
+        route = respx.post("https://api.example.com/api/v1/graph/").mock(
+            return_value=Response(200, json={"success": True})
+        )
+
+        with client:
+            result = client.upsert(
+                entities=[EntityApiSchema(entity_type="user", attributes={"id": "1"})]
+            )
+
+        assert json.loads(route.calls.last.request.content) == {
+            "entities": [{"entity_type": "user", "attributes": {"id": "1"}}]
+        }
+        assert isinstance(result, CreateEntitiesAndRelationshipsResponseSchema)
+        assert result.success is True
+
+    def test_upsert_validates_dict_items(self, client):
+        """Test that plain dict items are validated before being sent."""
+        route = respx.post("https://api.example.com/api/v1/graph/").mock(
+            return_value=Response(200, json={"success": True})
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            client.upsert(entities=[{"entity_type": "user", "attributes": {"id": "1"}}])
+
+        assert json.loads(route.calls.last.request.content) == {
+            "entities": [{"entity_type": "user", "attributes": {"id": "1"}}]
+        }
+
+    def test_upsert_many_chunks_requests(self, client):
+        """Test that entities are sent in chunks, before relationships."""
+        route = respx.post("https://api.example.com/api/v1/graph/").mock(
+            return_value=Response(200, json={"success": True})
+        )
+        entities = [
+            EntityApiSchema(entity_type="user", attributes={"id": str(i)})
+            for i in range(3)
+        ]
+        relationships = [
+            RelationshipApiSchema(
+                source_type="user",
+                source_id="0",
+                target_type="user",
+                target_id="1",
+                relationship_type="follows",
+            )
+        ]
+
+        results = client.upsert_many(entities, relationships, chunk_size=2)
+
+        assert len(results) == 3
+        bodies = [json.loads(call.request.content) for call in route.calls]
+        assert [len(b.get("entities", [])) for b in bodies] == [2, 1, 0]
+        assert len(bodies[2]["relationships"]) == 1
+
+
+class TestSyncClientInit:
+    """Tests for SyncCinderClient construction."""
+
+    def test_response_models_warmed_up(self, client):
+        """Test that response models, including nested ones, are prepared."""
+        assert SchemaResponse in _warmed
+        assert EntitySchemaResponse in _warmed
+
+    def test_default_pool_limits(self, client):
+        """Test that the connection pool uses the client defaults."""
+        pool = client.client._transport._pool
+
+        assert pool._max_connections == 64
+        assert pool._max_keepalive_connections == 32
+        assert pool._keepalive_expiry == 60.0
+
+    def test_custom_pool_limits(self):
+        """Test that pool limits can be tuned through the constructor."""
+        client = SyncCinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            max_connections=10,
+            keepalive_expiry=5.0,
+        )
+        pool = client.client._transport._pool
+
+        assert pool._max_connections == 10
+        assert pool._max_keepalive_connections == 10
+        assert pool._keepalive_expiry == 5.0
+
+    def test_shared_transport(self):
+        """Test that clients built with the same transport share its pool."""
+        transport = build_transport(limits=httpx.Limits(max_connections=5))
+        first = SyncCinderClient(
+            base_url="https://api.example.com", token="token-a", transport=transport
+        )
+        second = SyncCinderClient(
+            base_url="https://api.example.com", token="token-b", transport=transport
+        )
+
+        assert first.client._transport is second.client._transport is transport
+        assert transport._pool._max_connections == 5
+
+    def test_default_clients_share_transport(self):
+        """Test that clients with default options share one pool, kept open."""
+        first = SyncCinderClient(base_url="https://api.example.com", token="token-a")
+        second = SyncCinderClient(base_url="https://api.example.org", token="token-b")
+        tuned = SyncCinderClient(
+            base_url="https://api.example.com", token="token-a", max_connections=10
+        )
+
+        transport = first.client._transport
+        assert second.client._transport is transport
+        assert tuned.client._transport is not transport
+
+        first.close()
+        assert first.client.is_closed
+        assert second.client._transport is transport
+        assert transport._pool._max_connections == 64
+
+    def test_http2_enabled_by_default(self, client):
+        """Test that HTTP/2 is enabled unless turned off."""
+        http1_client = SyncCinderClient(
+            base_url="https://api.example.com", token="test-token", http2=False
+        )
+
+        assert client.client._transport._pool._http2
+        assert not http1_client.client._transport._pool._http2
+
+
+class TestGetSyncClient:
+    """Tests for the get_sync_client factory."""
+
+    @pytest.fixture(autouse=True)
+    def clear_clients(self):
+        """Reset the shared client cache around each test."""
+        get_sync_client.cache_clear()
+        yield
+        get_sync_client.cache_clear()
+
+    def test_cache_clear_closes_clients(self):
+        """Test that clearing the cache closes the shared clients."""
+        client = get_sync_client(token="test-token", base_url="https://api.example.com")
+
+        get_sync_client.cache_clear()
+
+        assert client.client.is_closed
+        assert get_sync_client(
+            token="test-token", base_url="https://api.example.com"
+        ) is not client
+
+    def test_get_sync_client_reuses_client(self):
+        """Test that repeated calls share one client and connection pool."""
+        first = get_sync_client(token="test-token", base_url="https://api.example.com")
+        second = get_sync_client(token="test-token", base_url="https://api.example.com")
+        custom = get_sync_client(
+            token="test-token", base_url="https://api.example.com", timeout=5.0
+        )
+
+        assert first is second
+        assert custom is not first
+
+    def test_get_sync_client_ignores_close(self):
+        """Test that leaving `with` keeps a shared client open for other callers."""
+        route = respx.get("https://api.example.com/api/v1/graph/schema/").mock(
+            return_value=Response(200, json={
+                "entity_schemas": [],
+                "relationship_schemas": [],
+            })
+        )
+        first = get_sync_client(token="test-token", base_url="https://api.example.com")
+        with first:
+            first.get_graph_schema()
+
+        second = get_sync_client(token="test-token", base_url="https://api.example.com")
+        second.invalidate_schema_cache()
+        second.get_graph_schema()
+
+        assert second is first
+        assert not first.client.is_closed
+        assert route.call_count == 2
+
+    def test_get_sync_client_unhashable_kwargs(self):
+        """Test that unhashable arguments always create a new client."""
+        first = get_sync_client(
+            token="test-token", base_url="https://api.example.com", headers={"X-A": "1"}
+        )
+        second = get_sync_client(
+            token="test-token", base_url="https://api.example.com", headers={"X-A": "1"}
+        )
+
+        assert first is not second
+
+
+class TestSyncFastLists:
+    """Tests for decoding list pages with msgspec."""
+
+    def test_list_decisions_fast(self):
+        """Test that pages decode into structs convertible to Pydantic models."""
+        pytest.importorskip("msgspec")
+        respx.get("https://api.example.com/api/v1/decisions/").mock(
+            return_value=Response(200, json={
+                "items": [{
+                    "uuid": "decision-1",
+                    "entity": {"entity_type": "user", "attributes": {"id": "123"}},
+                    "notes": "",
+                    "is_training": False,
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "decision_type": "manual",
+                }],
+                "count": 1,
+            })
+        )
+
+        with SyncCinderClient(
+            base_url="https://api.example.com",
+            token="test-token",
+            fast_lists=True,
+        ) as client:
+            page = client.list_decisions()
+
+        assert page.count == 1
+        decision = page.items[0]
+        assert decision.uuid == "decision-1"
+        assert decision.created_at.year == 2026
+        assert isinstance(decision.to_model(), DecisionSchema)